@@ -200,6 +200,10 @@ def register_blueprints(app):
     app.register_blueprint(api_state)  # 状态同步 API
     app.register_blueprint(sht2bm_bp, url_prefix='/api')  # SHT2BM 使用 /api/bt 路径
 
+    # 每个请求开始时把爬虫状态字典绑定到 contextvar，状态同步热路径不再经 current_app 代理读取
+    from scheduler.state import bind_app_crawl_state_sources
+    app.before_request(bind_app_crawl_state_sources)
+
     logger.info("[BLUEPRINT] 所有蓝图已注册：pages, api_core, api_crawl, api_tasks, api_state, sht2bm")
 
 
@@ -38,6 +38,15 @@ _crawl_start_lock = threading.Lock()
 logger = logging.getLogger(__name__)
 
 
+def _mark_crawl_state_dirty():
+    """直接修改 CRAWL_STATUS/PROGRESS/CONTROL 后调用，使下次 sync_crawl_state 执行实际同步"""
+    try:
+        from scheduler.state import mark_crawl_state_dirty
+        mark_crawl_state_dirty()
+    except Exception as e:
+        logger.debug(f"[CRAWLER] 标记爬虫状态变更失败: {e}")
+
+
 # ==================== 爬虫控制API ====================
 
 @api_crawl_bp.route('/crawl/status')
@@ -231,6 +240,7 @@ def api_crawl_start():
         # 立即设置状态为 True，防止重复点击
         crawl_status['is_crawling'] = True
         crawl_status['message'] = '正在初始化...'
+        _mark_crawl_state_dirty()
 
         # 同步到共享状态
         cache_manager.shared_set(CacheKeys.CRAWL_STATUS, crawl_status)
@@ -354,6 +364,7 @@ def api_crawl_start():
                     return f'正在爬取 {category_str} - {time_str} - {max_pages}页'
 
                 crawl_status['message'] = format_crawl_message(section_fids, date_mode, date_value, dateline, max_pages)
+                _mark_crawl_state_dirty()
                 logger.info(f"[CRAWLER] 准备启动爬虫: {crawl_status['message']}")
 
                 try:
@@ -382,14 +393,17 @@ def api_crawl_start():
                     run_crawling_with_options(section_fids=section_fids, date_mode=date_mode, date_value=date_value, dateline=dateline, max_pages=max_pages, page_mode=page_mode, page_range=page_range, task_type='manual')
                     crawl_status['message'] = '爬取完成'
                     crawl_status['last_crawl_time'] = datetime.now().isoformat()
+                    _mark_crawl_state_dirty()
                     logger.info(f"[CRAWLER] 爬虫任务完成")
                 except Exception as e:
                     import traceback
                     logger.error(f"✗ [CRAWLER] 爬取异常详情: {traceback.format_exc()}")
                     crawl_status['message'] = f'爬取出错: {str(e)}'
+                    _mark_crawl_state_dirty()
                 finally:
                     crawl_status['is_crawling'] = False
                     crawl_status['is_paused'] = False  # 确保清除暂停标志
+                    _mark_crawl_state_dirty()
                     logger.info(f"[CRAWLER] 爬虫任务完成")
 
                     # 重置状态协调器到空闲状态
@@ -406,6 +420,7 @@ def api_crawl_start():
                         crawl_control = app.config.get('CRAWL_CONTROL', {})
                         crawl_control['paused'] = False
                         crawl_control['stop'] = False
+                        _mark_crawl_state_dirty()
                         cache_manager.shared_set(CacheKeys.CRAWL_CONTROL, crawl_control)
                         cache_manager.shared_set(CacheKeys.CRAWL_STATUS, crawl_status)
                     except Exception as cache_err:
@@ -441,6 +456,7 @@ def api_crawl_start():
                 crawl_status = app.config.get('CRAWL_STATUS', {})
                 crawl_status['is_crawling'] = False
                 crawl_status['message'] = f'任务异常终止: {str(e)[:100]}'
+                _mark_crawl_state_dirty()
 
                 from crawler_control.cc_control_bridge import get_crawler_control_bridge
                 bridge = get_crawler_control_bridge()
@@ -503,6 +519,11 @@ def api_crawl_stop():
         bridge = get_crawler_control_bridge()
         signal_id = bridge.send_stop_signal()
 
+        # 置位调度器停止事件，立即唤醒可中断休眠
+        # （on_stop 回调仅在爬虫线程解析过桥接器后才注册，此处不能依赖它）
+        from scheduler.utils import stop_event
+        stop_event.set()
+
         # 更新状态显示
         crawl_status['message'] = '正在停止...'
 
@@ -510,6 +531,7 @@ def api_crawl_stop():
         crawl_control = current_app.config.get('CRAWL_CONTROL', {})
         crawl_control['stop'] = True
         crawl_control['paused'] = False
+        _mark_crawl_state_dirty()
         cache_manager.shared_set(CacheKeys.CRAWL_CONTROL, crawl_control)
         cache_manager.shared_set(CacheKeys.CRAWL_STATUS, crawl_status)
 
@@ -624,6 +646,7 @@ def api_crawl_pause():
         # 同步到共享状态（保持兼容性）
         crawl_control = current_app.config.get('CRAWL_CONTROL', {})
         crawl_control['paused'] = True
+        _mark_crawl_state_dirty()
         cache_manager.shared_set(CacheKeys.CRAWL_CONTROL, crawl_control)
         cache_manager.shared_set(CacheKeys.CRAWL_STATUS, crawl_status)
 
@@ -710,6 +733,7 @@ def api_crawl_resume():
         # 同步到共享状态（保持兼容性）
         crawl_control = current_app.config.get('CRAWL_CONTROL', {})
         crawl_control['paused'] = False
+        _mark_crawl_state_dirty()
         cache_manager.shared_set(CacheKeys.CRAWL_CONTROL, crawl_control)
         cache_manager.shared_set(CacheKeys.CRAWL_STATUS, crawl_status)
 
@@ -792,6 +816,7 @@ def api_force_clear_crawl():
 
         crawl_progress = current_app.config.get('CRAWL_PROGRESS', {})
         crawl_progress.clear()
+        _mark_crawl_state_dirty()
 
         # 4. 清除缓存中的共享状态
         cache_manager.shared_set(CacheKeys.IS_CRAWLING, False)
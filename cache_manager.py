@@ -9,12 +9,36 @@ import os
 import json
 import time
 import logging
+import threading
 from functools import wraps
 from typing import Any, Optional, Union, Dict
 from configuration import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _dumps(value: Any) -> str:
+    """序列化为 JSON 文本，优先使用 orjson，不支持的类型回退到标准库"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _loads(raw):
+    """解析 JSON 文本，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class MemoryCache:
     """内存缓存实现 - 简单的LRU缓存"""
     
@@ -65,6 +89,7 @@ class RedisCache:
         try:
             import redis
             self.redis = redis.from_url(redis_url, decode_responses=True)
+            self._watch_error = redis.WatchError
             self.default_ttl = default_ttl
             self.available = True
             logger.info(f"Redis 缓存已连接: {redis_url}")
@@ -76,10 +101,20 @@ class RedisCache:
         if not self.available: return None
         try:
             val = self.redis.get(key)
-            return json.loads(val) if val else None
+            return _loads(val) if val else None
         except Exception as e:
             logger.error(f"Redis 获取失败: {e}")
             return None
+
+    def mget(self, keys) -> list:
+        """批量获取（单次 MGET 往返），缺失或失败的键返回 None"""
+        if not self.available: return [None] * len(keys)
+        try:
+            vals = self.redis.mget(keys)
+            return [_loads(val) if val else None for val in vals]
+        except Exception as e:
+            logger.error(f"Redis 批量获取失败: {e}")
+            return [None] * len(keys)
             
     def set(self, key: str, value: Any, ttl: int = None):
         if not self.available: return
@@ -87,10 +122,33 @@ class RedisCache:
             self.redis.setex(
                 key, 
                 ttl or self.default_ttl, 
-                json.dumps(value, ensure_ascii=False)
+                _dumps(value)
             )
         except Exception as e:
             logger.error(f"Redis 设置失败: {e}")
+
+    def update(self, key: str, partial: Dict, ttl: int = None) -> Optional[Dict]:
+        """将 partial 合并进 key 对应的字典（WATCH/MULTI 乐观事务，冲突时重试），返回合并后的值"""
+        if not self.available: return None
+        try:
+            with self.redis.pipeline() as pipe:
+                while True:
+                    try:
+                        pipe.watch(key)
+                        val = pipe.get(key)
+                        value = _loads(val) if val else None
+                        if not isinstance(value, dict):
+                            value = {}
+                        value.update(partial)
+                        pipe.multi()
+                        pipe.setex(key, ttl or self.default_ttl, _dumps(value))
+                        pipe.execute()
+                        return value
+                    except self._watch_error:
+                        continue
+        except Exception as e:
+            logger.error(f"Redis 合并更新失败: {e}")
+            return None
             
     def delete(self, key: str):
         if not self.available: return
@@ -118,23 +176,42 @@ class FileCache:
         self.cache_dir = cache_dir
         self.default_ttl = default_ttl
         os.makedirs(self.cache_dir, exist_ok=True)
+        # 每个键一个槽位: key -> ((mtime_ns, size, inode), 文件内容)
+        # 文件未变化（stat 一致）时直接复用内容，省去 open/read；
+        # 槽位整体替换为新元组，GIL 下单次字典赋值/读取是原子的，读写均无需加锁
+        self._slots: Dict[str, tuple] = {}
+        self._paths: Dict[str, str] = {}
+        # 仅用于 update 的读-改-写，保证本进程内合并不丢字段
+        self._update_lock = threading.Lock()
         
     def _get_path(self, key: str) -> str:
-        # 移除非法字符
-        safe_key = "".join([c for c in key if c.isalnum() or c in ('-', '_')]).rstrip()
-        return os.path.join(self.cache_dir, f"{safe_key}.json")
+        path = self._paths.get(key)
+        if path is None:
+            # 移除非法字符
+            safe_key = "".join([c for c in key if c.isalnum() or c in ('-', '_')]).rstrip()
+            path = self._paths[key] = os.path.join(self.cache_dir, f"{safe_key}.json")
+        return path
 
     def get(self, key: str) -> Optional[Any]:
         path = self._get_path(key)
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except OSError:
             return None
         
         try:
-            # 检查有效期
-            mtime = os.path.getmtime(path)
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            slot = self._slots.get(key)
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+            if slot is not None and slot[0] == sig:
+                raw = slot[1]
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    raw = f.read()
+                self._slots[key] = (sig, raw)
+            # 每次重新解析，调用方拿到的始终是独立对象，可自由修改
+            data = _loads(raw)
             
+            # 检查有效期
             expire_at = data.get('_expire_at', 0)
             if expire_at > 0 and time.time() > expire_at:
                 return None
@@ -142,6 +219,10 @@ class FileCache:
             return data.get('value')
         except:
             return None
+
+    def mget(self, keys) -> list:
+        """批量获取，缺失或过期的键返回 None"""
+        return [self.get(key) for key in keys]
             
     def set(self, key: str, value: Any, ttl: int = None):
         path = self._get_path(key)
@@ -154,13 +235,27 @@ class FileCache:
         
         temp_path = path + ".tmp"
         try:
+            raw = _dumps(data)
             with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False)
+                f.write(raw)
             os.replace(temp_path, path)
+            st = os.stat(path)
+            self._slots[key] = ((st.st_mtime_ns, st.st_size, st.st_ino), raw)
         except Exception as e:
             logger.error(f"FileCache 设置失败: {e}")
 
+    def update(self, key: str, partial: Dict, ttl: int = None) -> Dict:
+        """将 partial 合并进 key 对应的字典并写回，返回合并后的值"""
+        with self._update_lock:
+            value = self.get(key)
+            if not isinstance(value, dict):
+                value = {}
+            value.update(partial)
+            self.set(key, value, ttl)
+        return value
+
     def delete(self, key: str):
+        self._slots.pop(key, None)
         path = self._get_path(key)
         if os.path.exists(path):
             try:
@@ -171,6 +266,7 @@ class FileCache:
     def clear(self):
         """清空缓存目录"""
         import shutil
+        self._slots.clear()
         if os.path.exists(self.cache_dir):
             shutil.rmtree(self.cache_dir)
             os.makedirs(self.cache_dir, exist_ok=True)
@@ -231,6 +327,12 @@ class CacheManager:
             return self._redis.get(key)
         return self._file.get(key)
 
+    def shared_mget(self, keys) -> list:
+        """批量获取多进程间共享的状态，返回与 keys 顺序一致的值列表 (Redis 单次 MGET > File)"""
+        if self._redis and self._redis.available:
+            return self._redis.mget(keys)
+        return self._file.mget(keys)
+
     def shared_set(self, key: str, value: Any, ttl: int = 3600):
         """设置多进程间共享的状态 (Redis & File)"""
         if self._redis and self._redis.available:
@@ -238,6 +340,26 @@ class CacheManager:
         # 无论是否有 Redis，都同步一份到文件，确保绝对可靠
         self._file.set(key, value, ttl)
 
+    def shared_update(self, key: str, partial: Dict, ttl: int = 3600) -> Optional[Dict]:
+        """合并更新多进程间共享的字典状态（只写入变更字段，一次写入代替读-改-写整份回填）
+
+        Redis 可用时在 Redis 端以事务合并，再把合并结果写入文件；否则直接在文件上合并
+        """
+        if self._redis and self._redis.available:
+            value = self._redis.update(key, partial, ttl)
+            if value is not None:
+                self._file.set(key, value, ttl)
+                return value
+        return self._file.update(key, partial, ttl)
+
+    def invalidate_data(self):
+        """清除资源统计与分类相关的所有缓存（资源增删或分类计数变化后调用）"""
+        keys = [CacheKeys.STATS, CacheKeys.CATEGORIES, CacheKeys.RESOURCE_STATS]
+        keys.extend(CacheKeys.build(CacheKeys.CATEGORIES_ALL, stats, defined)
+                    for stats in (True, False) for defined in (True, False))
+        for key in keys:
+            self.delete(key)
+
     def get_stats(self):
         """获取命中率统计"""
         total = self.stats['hits'] + self.stats['misses']
@@ -293,6 +415,9 @@ class CacheKeys:
     STATS = "data:stats"
     CATEGORIES = "data:categories"
     RESOURCES = "data:resources"
+    # 服务层查询结果（CategoryService.get_all_categories 按参数组合分键）
+    CATEGORIES_ALL = "data:categories:all"
+    RESOURCE_STATS = "data:resource_stats"
 
     # 搜索相关
     SEARCH = "search:results"
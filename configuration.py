@@ -122,6 +122,8 @@ class UnifiedConfigManager:
                 'HEARTBEAT_INTERVAL': 60,  # 心跳通知间隔(秒)
                 'SAFE_MODE': False,  # 安全模式开关，开启后资源卡片图片被模糊遮罩
                 'GLOBAL_ERROR_THRESHOLD': 300,  # 全局错误阈值，超过此值任务自动停止
+                'SEARCH_SHORT_TERM_TITLE_ONLY': False,  # 单个 1-2 字搜索词只匹配标题（不再匹配类型标签）
+                'SEARCH_MULTI_TERM_PREFIX_MATCH': False,  # 多词搜索先用 search_tsv 全文索引按词首预过滤（词中间的片段不再命中）
             },
             # --- 路径配置 (集中管理硬编码路径) ---
             'paths': {
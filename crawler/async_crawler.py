@@ -9,7 +9,7 @@ from __future__ import annotations  # 启用延迟类型注解评估，避免循
 
 import asyncio
 from curl_cffi.requests import AsyncSession
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 from datetime import datetime, timezone
 from collections import deque
 import logging
@@ -442,6 +442,46 @@ class AsyncSHTCrawler:
 
         return results
 
+    async def crawl_details_stream(self, urls: List[str]) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]]]]:
+        """
+        异步流式爬取多个详情页，按完成顺序逐个产出结果
+
+        Args:
+            urls: 详情页URL列表
+
+        Yields:
+            (下标, 解析后的资源数据)，下标对应 urls 中的位置，失败的数据为None
+        """
+        logger.info(f"[ASYNC] 开始流式爬取 {len(urls)} 个详情页")
+
+        if await self._maybe_handle_control_signal():
+            return
+
+        async def _fetch_one(idx: int, url: str):
+            return idx, await self.crawl_detail_page(url)
+
+        tasks = [asyncio.ensure_future(_fetch_one(i, url)) for i, url in enumerate(urls)]
+        success_count = 0
+        try:
+            for done in asyncio.as_completed(tasks):
+                idx, data = await done
+                if data is not None:
+                    success_count += 1
+                yield idx, data
+                # 检查是否应该停止（使用 SHT 实例的停止标志）
+                if self._parser._should_stop_crawling:
+                    logger.error("⛔ [ASYNC] 检测到停止标志，放弃剩余未完成的详情页")
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        logger.info(
+            f"[ASYNC] 详情页流式爬取结束 - "
+            f"成功: {success_count}/{len(urls)}"
+        )
+
     def _parse_tid_list(self, html: str) -> List[int]:
         """解析TID列表"""
         try:
@@ -881,8 +881,8 @@ class SHT(SHTBase):
                 for i, url in enumerate(urls):
                     # 检查控制信号（停止和暂停）
                     try:
-                        from scheduler.utils import check_stop_and_pause
-                        if check_stop_and_pause():
+                        from scheduler.utils import fast_check_stop
+                        if fast_check_stop():
                             logger.info(f"⛔ [CRAWLER] 检测到停止信号，剩余 {len(urls) - i} 个URL未爬取")
                             results.extend([None] * (len(urls) - i))
                             break
@@ -1243,6 +1243,28 @@ class SHT(SHTBase):
             logger.error(f"解析torrent文件失败：{e}")
             return None
     
+    def build_resource_row(self, data: Dict, section: str, tid: int, detail_url: str) -> Dict:
+        """将详情数据清理为可直接插入 Resource 表的字段字典"""
+        try:
+            from health import validator
+            validation_result = validator._validate_single(tid, detail_url, data)
+            if not validation_result['valid']:
+                logger.warning(f"❌ 保存前验证失败: tid={tid}, 原因: {', '.join(validation_result['reasons'])}")
+        except Exception as e:
+            logger.warning(f"验证过程出错: {e}")
+
+        return {
+            'title': data.get('title', '').strip()[:500],
+            'sub_type': data.get('sub_type', '').strip()[:200] if data.get('sub_type') else None,
+            'publish_date': self._normalize_date(data.get('publish_date', '')),
+            'magnet': data.get('magnet'),
+            'preview_images': data.get('preview_images'),
+            'size': data.get('size'),
+            'tid': tid,
+            'section': section[:100] if section else None,
+            'detail_url': detail_url[:500] if detail_url else None
+        }
+
     def save_to_db(self, data: Dict, section: str, tid: int, detail_url: str) -> bool:
         """将爬取的数据保存到数据库"""
         return self._save_to_db(data, tid, section, detail_url)
@@ -1255,16 +1277,6 @@ class SHT(SHTBase):
             
             @retry_on_lock(max_retries=3, initial_delay=0.5)
             def _do_save():
-                # 验证数据
-                try:
-                    from health import validator
-                    validation_result = validator._validate_single(tid, detail_url, data)
-                    if not validation_result['valid']:
-                        logger.warning(f"❌ 保存前验证失败: tid={tid}, 原因: {', '.join(validation_result['reasons'])}")
-                except Exception as e:
-                    logger.warning(f"验证过程出错: {e}")
-                    pass
-                
                 # 检查是否已存在
                 existing_resource = Resource.query.filter_by(tid=tid).first()
                 if existing_resource:
@@ -1284,32 +1296,18 @@ class SHT(SHTBase):
                         logger.debug(f"资源已存在，跳过: tid={tid}")
                     return False
                 
-                # 数据清理
-                title = data.get('title', '').strip()[:500]
-                sub_type = data.get('sub_type', '').strip()[:200] if data.get('sub_type') else None
-                publish_date = self._normalize_date(data.get('publish_date', ''))
-                
-                # 创建新资源
-                resource = Resource(
-                    title=title,
-                    sub_type=sub_type,
-                    publish_date=publish_date,
-                    magnet=data.get('magnet'),
-                    preview_images=data.get('preview_images'),
-                    size=data.get('size'),
-                    tid=tid,
-                    section=section[:100] if section else None,
-                    detail_url=detail_url[:500] if detail_url else None
-                )
+                # 验证并清理数据后创建新资源
+                row = self.build_resource_row(data, section, tid, detail_url)
+                title = row['title']
+                resource = Resource(**row)
                 
                 db.session.add(resource)
                 db.session.commit()
                 
                 # 清理统计缓存
                 try:
-                    from cache_manager import cache_manager, CacheKeys
-                    cache_manager.delete(CacheKeys.STATS)
-                    cache_manager.delete(CacheKeys.CATEGORIES)
+                    from cache_manager import cache_manager
+                    cache_manager.invalidate_data()
                 except: pass
                 
                 logger.info(f"✓ 成功保存资源: tid={tid}, title={title[:50]}...")
@@ -38,6 +38,8 @@ class CrawlerControlBridge:
         self.queue_manager = SignalQueueManager(redis_client=None)  # 使用内存队列
         self.coordinator = StateCoordinator(self.queue_manager)
         self.event_loop = EnhancedEventLoop(self.coordinator, check_interval=0.5)
+        # 信号回调：发送信号时按类型同步调用，供调度器置位本地事件
+        self._signal_callbacks = {'stop': [], 'pause': [], 'resume': []}
         
         self._initialized = True
         logger.info("CrawlerControlBridge initialized")
@@ -51,8 +53,32 @@ class CrawlerControlBridge:
         """
         logger.info("Sending stop signal through bridge")
         signal_id = self.queue_manager.send_signal('stop', {'source': 'api'})
+        self._fire_signal_callbacks('stop')
         return signal_id
     
+    def on_signal(self, signal_type: str, callback):
+        """
+        注册信号回调（每次发送该类型信号时调用，同一回调只注册一次）
+        
+        Args:
+            signal_type: 信号类型 ('stop', 'pause', 'resume')
+            callback: 无参可调用对象
+        """
+        callbacks = self._signal_callbacks[signal_type]
+        if callback not in callbacks:
+            callbacks.append(callback)
+    
+    def on_stop(self, callback):
+        """注册停止信号回调"""
+        self.on_signal('stop', callback)
+    
+    def _fire_signal_callbacks(self, signal_type: str):
+        for callback in list(self._signal_callbacks[signal_type]):
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"Signal callback failed ({signal_type}): {e}")
+    
     def send_pause_signal(self) -> str:
         """
         发送暂停信号
@@ -62,6 +88,7 @@ class CrawlerControlBridge:
         """
         logger.info("Sending pause signal through bridge")
         signal_id = self.queue_manager.send_signal('pause', {'source': 'api'})
+        self._fire_signal_callbacks('pause')
         return signal_id
     
     def send_resume_signal(self) -> str:
@@ -73,6 +100,7 @@ class CrawlerControlBridge:
         """
         logger.info("Sending resume signal through bridge")
         signal_id = self.queue_manager.send_signal('resume', {'source': 'api'})
+        self._fire_signal_callbacks('resume')
         return signal_id
     
     def check_control_signals(self) -> ControlAction:
@@ -89,6 +89,9 @@ class StateCoordinator:
         return Config.get_path('crawler_state')
     
     DEFAULT_STATE_FILE = None  # 动态设置
+
+    # 增量日志累计条数达到该值时写一次完整快照并清空日志
+    JOURNAL_COMPACT_THRESHOLD = 200
     
     def __init__(self, signal_queue: SignalQueueManager, shared_state_manager=None, 
                  persistence_file: str = None, enable_persistence: bool = True):
@@ -114,8 +117,16 @@ class StateCoordinator:
             from configuration import Config
             self.persistence_file = Config.get_path('crawler_state')
         
-        # 添加文件锁，防止并发读写
-        self._file_lock = threading.Lock()
+        # 进度增量日志（追加写），完整快照写入后清空
+        self.journal_file = f"{self.persistence_file}.journal"
+        self._journal_entries = 0
+        # 内存状态对应的快照文件标识 (mtime_ns, size, inode) 及已叠加的增量日志字节偏移；
+        # 快照未变化时重新加载只需读取偏移之后新追加的日志
+        self._snapshot_sig = None
+        self._journal_offset = 0
+
+        # 添加文件锁，防止并发读写（可重入：追加增量时可能在锁内触发快照压缩）
+        self._file_lock = threading.RLock()
 
         # 状态通知控制（避免过早/重复通知）
         self._last_notify_state = None
@@ -268,6 +279,12 @@ class StateCoordinator:
 
         with self._file_lock:  # 使用文件锁防止并发读写
             try:
+                sig = self._stat_snapshot()
+                if sig is not None and sig == self._snapshot_sig:
+                    # 快照未变化：只叠加上次读取之后新追加的增量日志
+                    self._apply_journal(self._current_state, self._journal_offset)
+                    return
+
                 with open(self.persistence_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
 
@@ -278,8 +295,11 @@ class StateCoordinator:
                     # 兼容旧格式（扁平结构）
                     state_data = data
 
-                # 更新内存状态
-                self._current_state = CrawlerState.from_dict(state_data)
+                # 更新内存状态（叠加快照之后的增量日志）
+                state = CrawlerState.from_dict(state_data)
+                self._apply_journal(state)
+                self._current_state = state
+                self._snapshot_sig = sig
                 # 频繁调用，不打印日志避免刷屏
 
             except Exception as e:
@@ -359,7 +379,7 @@ class StateCoordinator:
             if not msg:
                 msg = f"🔔 *爬虫状态变更*\n━━━━━━━━━━━━━━\n{old_label} → {new_label}\n⏰ 时间：{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n{reason}".rstrip()
                 parse_mode = 'Markdown'
-            _send_telegram_message(msg, parse_mode=parse_mode)
+            _send_telegram_message(msg, parse_mode=parse_mode, coalesce_key='state_change')
         except Exception as e:
             logger.debug(f"状态变更通知失败: {e}")
 
@@ -481,13 +501,8 @@ class StateCoordinator:
             )
     
     def update_progress(self, progress_data: dict):
-        """更新进度信息"""
-        self._current_state.progress.update(progress_data)
-        self._current_state.version += 1
-        
-        # 持久化状态
-        if self.enable_persistence:
-            self._persist_state()
+        """更新进度信息（仅追加变化的字段到增量日志）"""
+        self.persist_progress_delta(progress_data)
         
         # 同步到共享状态
         if self.shared_state:
@@ -496,6 +511,102 @@ class StateCoordinator:
             except Exception as e:
                 logger.error(f"Failed to sync progress to shared storage: {e}")
     
+    def persist_progress_delta(self, changes: dict) -> bool:
+        """
+        更新进度字段并仅持久化变化部分
+
+        传入的字段先与当前进度比对，只有值发生变化的键以 JSON 行追加到增量日志，
+        写入成本与变化大小成正比，与整体状态大小无关。值为 None 的键表示从进度中移除。
+        日志达到 JOURNAL_COMPACT_THRESHOLD 条时改为写完整快照。
+
+        Args:
+            changes: 进度字段（可包含未变化的键）
+
+        Returns:
+            bool: 是否成功持久化（无变化时视为成功）
+        """
+        with self._file_lock:
+            progress = self._current_state.progress
+            delta = {}
+            for key, value in changes.items():
+                if value is None:
+                    if key in progress:
+                        delta[key] = None
+                        progress.pop(key)
+                elif key not in progress or progress[key] != value:
+                    delta[key] = value
+                    progress[key] = value
+            if not delta:
+                return True
+            self._current_state.version += 1
+
+            if not self.enable_persistence:
+                return False
+
+            if self._journal_entries >= self.JOURNAL_COMPACT_THRESHOLD:
+                return self._persist_state()
+
+            try:
+                entry = {'progress': delta, 'version': self._current_state.version}
+                with open(self.journal_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                self._journal_entries += 1
+                return True
+            except Exception as e:
+                logger.error(f"Failed to append state journal: {e}")
+                return False
+
+    def _stat_snapshot(self) -> Optional[tuple]:
+        """返回快照文件标识 (mtime_ns, size, inode)，文件不存在时返回 None"""
+        try:
+            st = os.stat(self.persistence_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _apply_journal(self, state: CrawlerState, offset: int = 0):
+        """
+        将增量日志按顺序叠加到快照状态上
+
+        Args:
+            state: 待叠加的状态
+            offset: 起始字节偏移（0 表示从头重放）；读取后记录新的偏移
+        """
+        if not os.path.exists(self.journal_file):
+            self._journal_offset = 0
+            if not offset:
+                self._journal_entries = 0
+            return
+        try:
+            applied = 0
+            with open(self.journal_file, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() < offset:
+                    # 日志已被其他进程压缩重建，从头重放
+                    offset = 0
+                f.seek(offset)
+                incremental = offset > 0
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # 写入中或崩溃留下的不完整最后一行，留待下次读取
+                        break
+                    offset += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    applied += 1
+                    for key, value in entry.get('progress', {}).items():
+                        if value is None:
+                            state.progress.pop(key, None)
+                        else:
+                            state.progress[key] = value
+                    state.version = max(state.version, entry.get('version', state.version))
+            self._journal_entries = self._journal_entries + applied if incremental else applied
+            self._journal_offset = offset
+        except Exception as e:
+            logger.error(f"Failed to apply state journal: {e}")
+
     def save_page_loop_state(self, section_name: str, page_idx: int, progress_idx: int, 
                             pages_to_crawl_list: list, current_offset: int = 0):
         """
@@ -583,6 +694,13 @@ class StateCoordinator:
                 # 原子替换
                 os.replace(temp_file, self.persistence_file)
 
+                # 快照已包含全部增量，清空日志
+                if os.path.exists(self.journal_file):
+                    os.remove(self.journal_file)
+                self._journal_entries = 0
+                self._journal_offset = 0
+                self._snapshot_sig = self._stat_snapshot()
+
                 logger.debug(f"State persisted to {self.persistence_file}")
                 return True
 
@@ -608,6 +726,7 @@ class StateCoordinator:
                 return None
             
             # 读取文件
+            sig = self._stat_snapshot()
             with open(self.persistence_file, 'r', encoding='utf-8') as f:
                 persistence_data = json.load(f)
             
@@ -619,9 +738,11 @@ class StateCoordinator:
             # 恢复状态
             state_data = persistence_data['state']
             restored_state = CrawlerState.from_dict(state_data)
+            self._apply_journal(restored_state)
             
             # 验证状态一致性
             if self._validate_state_consistency(restored_state):
+                self._snapshot_sig = sig
                 logger.info(f"State restored successfully from {self.persistence_file}")
                 return restored_state
             else:
@@ -9,7 +9,8 @@ import logging
 from datetime import datetime, timedelta, timezone
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
-from sqlalchemy import text, Index
+from sqlalchemy import text, Index, event
+from sqlalchemy.orm import Session, object_session
 from typing import Dict, List, Any, Optional
 
 # 初始化 SQLAlchemy 实例
@@ -17,6 +18,14 @@ db = SQLAlchemy()
 
 logger = logging.getLogger(__name__)
 
+# 残缺数据判定条件（SQL 文本）：服务层筛选与 resource 表上的部分索引共用同一表达式，
+# 查询条件与索引条件一致时 SQLite/PostgreSQL 规划器才能选用部分索引
+RESOURCE_MISSING_CONDITIONS = {
+    'sub_type': "(sub_type IS NULL OR sub_type IN ('', '未知'))",
+    'date': "(publish_date IS NULL OR publish_date IN ('', '未知'))",
+    'size': "(size IS NULL OR size = 0)",
+}
+
 class Resource(db.Model):
     """资源数据模型 - 存储从SHT网站抓取的资源信息"""
     id = db.Column(db.Integer, primary_key=True)
@@ -34,6 +43,7 @@ class Resource(db.Model):
     # 添加复合索引以提高复杂查询性能
     __table_args__ = (
         db.Index('idx_section_date', 'section', 'publish_date'),  # 分类+日期复合索引
+        db.Index('idx_section_created', 'section', 'created_at'),  # 分类+入库时间复合索引（按分类取最新资源，倒序扫描）
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -90,6 +100,12 @@ class Resource(db.Model):
 
             if total_removed > 0:
                 db.session.commit()
+                # 原生 SQL 删除不经过 ORM 事件，需手动清除统计/分类缓存
+                try:
+                    from cache_manager import cache_manager
+                    cache_manager.invalidate_data()
+                except Exception as e:
+                    logger.debug(f"清除统计缓存失败: {e}")
                 logger.info(f"清理了 {total_removed} 条重复记录")
             return total_removed
         except Exception as e:
@@ -97,6 +113,43 @@ class Resource(db.Model):
             logger.error(f"清理重复记录失败: {e}")
             return 0
 
+    @classmethod
+    def bulk_insert_ignore(cls, rows: List[Dict[str, Any]]) -> int:
+        """
+        批量插入资源，tid 已存在的行直接忽略
+
+        只执行一条 INSERT 语句，不提交事务（由调用方负责）
+        返回实际插入的行数
+        """
+        if not rows:
+            return 0
+
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+            stmt = insert(cls).values(rows).on_conflict_do_nothing(index_elements=['tid'])
+        elif dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+            stmt = insert(cls).values(rows).on_conflict_do_nothing(index_elements=['tid'])
+        elif dialect in ('mysql', 'mariadb'):
+            # 只忽略 tid 冲突：INSERT IGNORE 会把超长截断等数据错误降级为警告并静默写入。
+            # 开启 CLIENT_FOUND_ROWS 时冲突行同样计入 rowcount，插入数按写入前未存在的 tid 计算
+            from sqlalchemy.dialects.mysql import insert
+            tids = {r['tid'] for r in rows}
+            existing = {t[0] for t in db.session.query(cls.tid).filter(cls.tid.in_(tids))}
+            stmt = insert(cls).values(rows)
+            db.session.execute(stmt.on_duplicate_key_update(tid=stmt.inserted.tid))
+            return len(tids - existing)
+        else:
+            # 其他数据库：先过滤已存在的 tid 再逐条加入会话
+            existing = {t[0] for t in db.session.query(cls.tid).filter(cls.tid.in_([r['tid'] for r in rows]))}
+            new_rows = [r for r in rows if r['tid'] not in existing]
+            db.session.add_all([cls(**r) for r in new_rows])
+            return len(new_rows)
+
+        result = db.session.execute(stmt)
+        return max(result.rowcount or 0, 0)
+
     @classmethod
     def get_statistics(cls) -> Dict[str, Any]:
         """获取资源统计信息（高效查询）"""
@@ -401,6 +454,17 @@ class FailedTID(db.Model):
             query = query.filter_by(section=section)
         return query.order_by(cls.retry_count.asc(), cls.created_at.desc()).limit(limit).all()
 
+    @classmethod
+    def mark_success_many(cls, tids: List[int], commit: bool = True) -> int:
+        """批量记录重试成功，返回更新的行数"""
+        if not tids:
+            return 0
+        updated = cls.query.filter(cls.tid.in_(tids), cls.status != 'success').update(
+            {'status': 'success'}, synchronize_session=False)
+        if commit:
+            db.session.commit()
+        return updated
+
     @classmethod
     def mark_success(cls, tid: int) -> bool:
         """记录重试成功"""
@@ -464,4 +528,31 @@ class ValidationLog(db.Model):
             }
         except Exception as e:
             logger.error(f"获取验证统计失败: {e}")
-            return {'total': 0, 'passed': 0, 'failed': 0, 'success_rate': 0}
\ No newline at end of file
+            return {'total': 0, 'passed': 0, 'failed': 0, 'success_rate': 0}
+
+
+# ==================== 缓存失效 ====================
+# 经 ORM 新增或删除资源后清除统计/分类缓存：写入时只在会话上打标记，
+# 事务提交后统一清除一次，避免逐行访问缓存后端
+
+@event.listens_for(Resource, 'after_insert')
+@event.listens_for(Resource, 'after_delete')
+def _mark_resources_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info['resources_changed'] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_data_cache_on_commit(session):
+    if session.info.pop('resources_changed', False):
+        try:
+            from cache_manager import cache_manager
+            cache_manager.invalidate_data()
+        except Exception as e:
+            logger.debug(f"清除统计缓存失败: {e}")
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_resource_changes_on_rollback(session):
+    session.info.pop('resources_changed', None)
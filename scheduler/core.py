@@ -9,23 +9,60 @@ import logging
 import os
 import json
 import random
+import queue
 import asyncio
 import concurrent.futures
 import datetime as _dt
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
 from crawler import SHT, AsyncSHTCrawler
 from utils.async_bridge import run_async
 from sqlalchemy import func
 from models import db, Resource, FailedTID, Category
-from configuration import config_manager
+from configuration import config_manager, Config
+from crawler_control.cc_control_bridge import get_crawler_control_bridge
 from utils import get_flask_app, get_flask_app_context
 from constants import SECTION_MAP, SECTION_NAME_TO_FID
-from .state import sync_crawl_state
+from .state import sync_crawl_state, mark_crawl_state_dirty, bind_crawl_state_sources, crawl_state_sources_var
 from .notifier import _send_telegram_message, _send_crawl_report, render_message_template
-from .utils import stop_event, pause_event, sleep_interruptible
+from .utils import stop_event, pause_event, sleep_interruptible, check_stop_and_pause, fast_check_stop
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# 未指定板块时的默认目标板块
+_ALL_SECTION_FIDS = tuple(SECTION_MAP.keys())
+
+# 批次结算时状态广播的最小间隔（秒），最后一个批次不受限制
+STATE_UPDATE_MIN_INTERVAL = 1.0
+
+# 摘要中页面明细条目超过该值时流式写入摘要文件
+SUMMARY_STREAM_PAGE_THRESHOLD = 50_000
+
+# 摘要文件与日志目录路径在配置初始化后不再变化，模块加载时解析一次
+try:
+    _SUMMARY_JSON_PATH = Config.get_path('summary_json')
+    _LOG_DIR = Config.get_path('log_dir')
+except Exception:
+    _LOG_DIR = Config.LOG_DIR
+    _SUMMARY_JSON_PATH = os.path.join(_LOG_DIR, 'summary.json')
+
+# 日志目录在进程内只需确保创建一次
+_LOG_DIR_READY = False
+
+# 任务异常终止时的 Telegram 通知
+_CRAWL_EXCEPTION_TMPL = (
+    "❌ *爬虫任务异常终止*\n"
+    "━━━━━━━━━━━━━━\n"
+    "⚠️ 错误信息：{err}\n"
+    "⏰ 终止时间：{ts}\n"
+    "💡 建议：检查日志获取详细信息"
+)
+
 
 def update_crawl_state(updates):
     """
@@ -69,6 +106,7 @@ def update_crawl_state(updates):
                 crawl_progress[key] = value
             elif key in ['stop', 'paused']:
                 crawl_control[key] = value
+        mark_crawl_state_dirty()
 
         # 3. 同步到共享缓存，便于跨进程读取
         try:
@@ -83,6 +121,126 @@ def update_crawl_state(updates):
         logger.debug(f"更新状态失败: {e}")
 
 
+def _commit_resource_batch(rows):
+    """
+    批量写入一个批次的新资源并统一提交
+
+    tid 冲突的行由数据库直接忽略，同时把对应的失败 TID 标记为成功。
+    成功后清除统计和分类缓存；失败时回滚，并把整批 TID 登记到 FailedTID 以便重试
+
+    返回实际插入的行数；提交失败返回 None
+    """
+    if not rows:
+        return 0
+    try:
+        inserted = Resource.bulk_insert_ignore(rows)
+        FailedTID.mark_success_many([r['tid'] for r in rows], commit=False)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"❌ 批量提交资源失败: {e}")
+        for r in rows:
+            FailedTID.add(tid=r['tid'], section=r.get('section'), url=r.get('detail_url'), reason='保存失败')
+        return None
+
+    try:
+        from cache_manager import cache_manager
+        cache_manager.invalidate_data()
+    except Exception:
+        pass
+    return inserted
+
+
+def _prepare_detail_row(sht, data, section, tid, detail_url, date_filter=None, reason_prefix=''):
+    """
+    处理单条详情采集结果
+
+    无效结果（解析失败或无磁力链接）登记到 FailedTID；
+    有效且通过日期过滤的结果转换为待写入的行
+
+    返回 (row, failed)：row 为待写入的字典或 None，failed 表示是否新增了失败记录
+    """
+    if not data or not data.get('magnet'):
+        reason = f"{reason_prefix}解析失败" if not data else f"{reason_prefix}无磁力链接"
+        failed = bool(FailedTID.add(tid=tid, section=section, url=detail_url, reason=reason))
+        if failed:
+            logger.debug(f"⚠️ {tid} 进入重试列表")
+        return None, failed
+
+    if date_filter and not date_filter((data.get('publish_date') or '').strip()):
+        return None, False
+
+    return sht.build_resource_row(data, section, tid, detail_url), False
+
+
+def _burst_fetch_tid_lists(sht, urls, timeout=60.0):
+    """
+    并发获取多个列表页的 TID 列表
+
+    复用 sht 的代理与 Cookie，返回值与 urls 一一对应
+    """
+    proxy = sht.proxies.get('http') if (hasattr(sht, 'proxies') and sht.proxies) else None
+    cookies = sht.cookie if hasattr(sht, 'cookie') else {'_safe': ''}
+
+    async def _fetch():
+        async with AsyncSHTCrawler(max_connections=len(urls), proxy=proxy, cookies=cookies) as c:
+            return await c.crawl_tids_batch(urls)
+
+    return run_async(_fetch(), timeout=timeout)
+
+
+def _query_existing_tids(tids, chunk_size=500):
+    """查询已入库的 TID 集合，按 chunk_size 分批执行 IN 查询"""
+    tids = list(tids)
+    existing = set()
+    for start in range(0, len(tids), chunk_size):
+        rows = db.session.query(Resource.tid).filter(Resource.tid.in_(tids[start:start + chunk_size])).all()
+        existing.update(t[0] for t in rows)
+    return existing
+
+
+def _new_section_page_stat():
+    """单个板块的页面统计模板"""
+    return {
+        'successful_pages': [],
+        'failed_pages': [],
+        'total_pages': 0,
+        'total_saved': 0,
+        'total_skipped': 0
+    }
+
+
+def _dump_json(obj, path, stream=False):
+    """
+    把对象写成缩进 JSON 文件，优先使用 orjson，未安装时回退到标准库
+
+    stream=True 时用 iterencode 分段写入，内存占用只与写缓冲区大小相关，用于超大对象
+    """
+    if stream:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(encoder.iterencode(obj))
+        return
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(path, 'wb') as f:
+            f.write(payload)
+        return
+    # 先整体序列化再一次写入，避免 json.dump 逐个片段调用 write
+    payload = json.dumps(obj, ensure_ascii=False, indent=2)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(payload)
+
+
+def _load_json(path):
+    """读取 JSON 文件，优先使用 orjson"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def run_crawling_task():
     """执行爬取任务"""
     logger.info("开始执行爬取任务...")
@@ -137,6 +295,11 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
     """
     # 用于跟踪通知发送状态
     notification_sent = False
+    summary = None
+    # 控制桥在任务开始时获取一次，后续（含异常与 finally 路径）复用
+    bridge = None
+    # 绑定到本线程上下文的状态字典（仅在 Flask 应用上下文中读取时绑定）
+    sources_token = None
 
     try:
         global stop_event, pause_event
@@ -149,6 +312,7 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
             crawl_status = current_app.config.get('CRAWL_STATUS', {})
             crawl_control = current_app.config.get('CRAWL_CONTROL', {})
             crawl_progress = current_app.config.get('CRAWL_PROGRESS', {})
+            sources_token = bind_crawl_state_sources(crawl_status, crawl_progress, crawl_control)
         except Exception:
             from cache_manager import cache_manager, CacheKeys
             crawl_status = cache_manager.shared_get(CacheKeys.CRAWL_STATUS) or {}
@@ -157,7 +321,6 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
 
         # 强制重置并设置状态机
         try:
-            from crawler_control.cc_control_bridge import get_crawler_control_bridge
             bridge = get_crawler_control_bridge()
 
             # 1. 清除所有旧信号
@@ -187,9 +350,7 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                 logger.info("✅ 已通知状态机：爬虫进入running状态")
 
         except Exception as e:
-            logger.error(f"❌ 状态机初始化失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"❌ 状态机初始化失败: {e}", exc_info=True)
             # 不要继续，因为控制系统不工作
             raise RuntimeError(f"无法初始化爬虫控制系统: {e}")
     
@@ -206,6 +367,7 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
         start_time = time.time()
         update_crawl_state({'start_time': start_time})
         last_notification_time = start_time  # 用于5分钟定时通知
+        last_heartbeat_key = None  # 上次心跳时的进度快照，无变化时跳过推送
         
         # 显示日期过滤设置和智能建议
         if date_mode == 'all' or not date_mode:
@@ -251,8 +413,6 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
         
         logger.debug(f"🔍 传入的section_fids类型: {type(section_fids)}, 内容: {section_fids}")
         
-        from constants import SECTION_MAP, SECTION_NAME_TO_FID
-        
         sht = SHT()
         
         chosen_items = []
@@ -501,6 +661,18 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
             logger.warning(f"⚠️ 校正预估总页数失败，使用初始值: {e}")
             # 保持使用初始计算的 estimated_total
     
+        # 列表页 URL 的时间范围参数只拼接一次
+        dl_v = str(dateline).strip() if dateline else ''
+        list_url_suffix = f'&orderby=dateline&filter=dateline&dateline={dl_v}' if dl_v and dl_v != '0' else ''
+
+        # 日期过滤谓词只构建一次，主循环与重试阶段共用
+        if date_mode == 'day' and date_value:
+            date_filter = lambda pub: pub == date_value
+        elif date_mode == 'month' and date_value:
+            date_filter = lambda pub: pub.startswith(date_value)
+        else:
+            date_filter = None
+
         for fid, section_name in chosen_items:
             if not section_name:
                 continue
@@ -726,8 +898,6 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
             # 检查是否从暂停恢复，如果是则从保存的位置继续
             resume_offset = 0
             try:
-                from crawler_control.cc_control_bridge import get_crawler_control_bridge
-                bridge = get_crawler_control_bridge()
                 saved_loop_state = bridge.coordinator.get_page_loop_state()
                 
                 if saved_loop_state and saved_loop_state.get('section_name') == section_name:
@@ -735,15 +905,14 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                     resume_offset = saved_loop_state.get('current_offset', 0)
                     if resume_offset > 0:
                         logger.info(f"📍 从暂停点恢复: 分类={section_name}, 从偏移量={resume_offset} 继续")
-                        # 清除保存的状态
-                        bridge.coordinator._current_state.progress.pop('page_loop_state', None)
-                        bridge.coordinator.force_persist()
+                        # 清除保存的状态（只追加一条增量，不重写整个状态文件）
+                        bridge.coordinator.persist_progress_delta({'page_loop_state': None})
             except Exception as e:
                 logger.warning(f"⚠️ 恢复暂停状态失败: {e}")
             
             # 在循环中使用，支持从保存的偏移量继续
-            pages_to_crawl_list = list(pages_to_crawl)
-            pages_to_process = pages_to_crawl_list[resume_offset:]
+            # pages_to_crawl 为 range，切片仍是 range，不会物化页码列表
+            pages_to_process = pages_to_crawl[resume_offset:]
             
             # v1.4.0: 加速查漏模式 (Burst Mode)
             # 如果是异步模式且页数较多，开启分页批处理，并发获取多页 TID
@@ -752,20 +921,24 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
             
             if page_batch_size > 1:
                 logger.info(f"⚡ [{section_name}] 启用加速查漏模式: 每批次并发处理 {page_batch_size} 页列表")
+
+            # 板块内循环使用的配置项只读取一次，避免每页重复查询
+            heartbeat_interval = int(config_manager.get('HEARTBEAT_INTERVAL', 60))
+            max_c = config_manager.get('CRAWLER_MAX_CONCURRENCY', 20)
+            force_thread_mode = config_manager.get('FORCE_THREAD_DETAIL_CRAWL', True)
+            error_threshold = config_manager.get('GLOBAL_ERROR_THRESHOLD', 300)
+            last_state_update = 0.0
             
             i = 0
             while i < len(pages_to_process):
                 batch_indices = pages_to_process[i:i + page_batch_size]
-                from .utils import check_stop_and_pause
-                if check_stop_and_pause(): break
+                if stop_event.is_set() or check_stop_and_pause(): break
                 burst_results = []
+                # 本批次各页的列表 URL，扫描失败时直接作为重试地址
+                burst_urls = [f'https://sehuatang.org/forum.php?mod=forumdisplay&fid={fid}&mobile=2&page={p}{list_url_suffix}'
+                              for p in batch_indices]
                 if page_batch_size > 1:
                     # v1.4.6: [优化] 构造URL并同步UI状态
-                    burst_urls = [f'https://sehuatang.org/forum.php?mod=forumdisplay&fid={fid}&mobile=2&page={p}' for p in batch_indices]
-                    if dateline and str(dateline).strip() and str(dateline).strip() != '0':
-                        dl_v = str(dateline).strip()
-                        burst_urls = [f'{u}&orderby=dateline&filter=dateline&dateline={dl_v}' for u in burst_urls]
-                    
                     target_pages_desc = f"第{batch_indices[0]}-{batch_indices[-1]}页"
                     update_crawl_state({
                         'message': f'正在并发扫描 [{section_name}] {target_pages_desc}...',
@@ -773,30 +946,23 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                     })
 
                     try:
-                        p_a = sht.proxies.get('http') if (hasattr(sht, 'proxies') and sht.proxies) else None
-                        c_a = sht.cookie if hasattr(sht, 'cookie') else {'_safe': ''}
-                        async def f_b():
-                            async with AsyncSHTCrawler(max_connections=page_batch_size, proxy=p_a, cookies=c_a) as c:
-                                return await c.crawl_tids_batch(burst_urls)
-                        burst_results = run_async(f_b(), timeout=60.0)
+                        burst_results = _burst_fetch_tid_lists(sht, burst_urls)
                     except Exception as burst_err:
-                        import traceback
                         logger.error(f"❌ [BURST] 列表批量获取致命异常: {burst_err}")
-                        logger.debug(traceback.format_exc())
+                        # exc_info 由 logging 在记录真正输出时才格式化堆栈
+                        logger.debug("[BURST] 异常堆栈", exc_info=True)
                         burst_results = [[] for _ in batch_indices]
                 else:
-                    p_idx = batch_indices[0]
-                    u = f'https://sehuatang.org/forum.php?mod=forumdisplay&fid={fid}&mobile=2&page={p_idx}'
-                    if dateline and str(dateline).strip() and str(dateline).strip() != '0':
-                        u += f'&orderby=dateline&filter=dateline&dateline={str(dateline).strip()}'
                     try: 
-                        burst_results = [sht.crawler_tid_list(u) or []]
+                        burst_results = [sht.crawler_tid_list(burst_urls[0]) or []]
                     except Exception as sync_err:
                         logger.error(f"❌ [SYNC] 同步获取TID列表失败: {sync_err}")
                         burst_results = [[]]
                 
                 batch_tasks = []
                 reached_boundary = False
+                # 批次内逐页的展示状态先合并，批次结算时一次性广播
+                pending_state = {}
                 
                 # --- 步骤 2: 汇总缺失详情任务 ---
                 for offset, page_tids in enumerate(burst_results):
@@ -807,7 +973,7 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                     sect_prog_curr = (p_idx_curr / adjusted_pages) * 100
                     pg_disp_curr = f"第{curr_p}/{display_total_pages}页"
                     
-                    update_crawl_state({
+                    pending_state.update({
                         'current_page_actual': curr_p,
                         'max_pages_actual': display_total_pages,
                         'current_page_task': p_idx_curr,
@@ -819,9 +985,12 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
 
                     # 心跳监控
                     try:
-                        heartbeat_interval = int(config_manager.get('HEARTBEAT_INTERVAL', 60))
                         cur_t = time.time()
-                        if cur_t - last_notification_time >= heartbeat_interval:
+                        heartbeat_key = (section_name, p_idx_curr, total_saved, total_failed, total_skipped)
+                        if cur_t - last_notification_time >= heartbeat_interval and heartbeat_key == last_heartbeat_key:
+                            # 进度自上次心跳以来没有变化，不重复渲染和推送
+                            last_notification_time = cur_t
+                        elif cur_t - last_notification_time >= heartbeat_interval:
                             elapsed_m = int((cur_t - start_time) / 60)
                             total_prog = int((crawl_progress.get('processed_pages', 0) / max(crawl_progress.get('estimated_total_pages', 1), 1)) * 100)
                             
@@ -839,8 +1008,9 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                             if not h_msg: # Fallback
                                 h_msg = f"💓 *Burst Mode 运行中*\n⏱️ 已运行: {elapsed_m}m\n📂 板块: {section_name}\n📄 进度: {pg_disp_curr} ({sect_prog_curr:.1f}%)\n✅ 已存: {total_saved}\n❌ 失败: {total_failed}"
                                 p_mode = 'Markdown'
-                            _send_telegram_message(h_msg, parse_mode=p_mode)
+                            _send_telegram_message(h_msg, parse_mode=p_mode, droppable=True, coalesce_key='heartbeat')
                             last_notification_time = cur_t
+                            last_heartbeat_key = heartbeat_key
                     except: pass
 
                     if not page_tids:
@@ -858,17 +1028,14 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                         if 'failed_pages' not in crawl_progress:
                             crawl_progress['failed_pages'] = []
                         
-                        # 构建该页面的完整URL用于重试时定位
-                        retry_url = f"https://sehuatang.org/forum.php?mod=forumdisplay&fid={fid}&mobile=2&page={curr_p}"
-                        if dateline and str(dateline).strip() and str(dateline).strip() != '0':
-                            retry_url += f"&orderby=dateline&filter=dateline&dateline={str(dateline).strip()}"
-                            
+                        # 复用本批次已构建的列表URL用于重试时定位
                         crawl_progress['failed_pages'].append({
                             'section_name': section_name,
                             'section_fid': fid,
                             'page': curr_p,
-                            'url': retry_url
+                            'url': burst_urls[offset]
                         })
+                        mark_crawl_state_dirty()
                         continue
                     
                     page_stats['total_pages_attempted'] += 1
@@ -902,102 +1069,115 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                 if batch_tasks:
                     logger.info(f"🚀 [{section_name}] 发现 {len(batch_tasks)} 个新增资源，开始并发详情采集...")
                     m_urls = [t[1] for t in batch_tasks]
-                    m_results = []
-                    
+                    m_results = [None] * len(m_urls)
+                    # 已在采集过程中处理过的下标（异步流式模式下边到达边处理）
+                    handled = set()
+                    to_insert = []
+
+                    def collect_detail(idx, data):
+                        nonlocal total_failed
+                        tid, u_d = batch_tasks[idx]
+                        handled.add(idx)
+                        row, failed = _prepare_detail_row(sht, data, section_name, tid, u_d, date_filter)
+                        if failed:
+                            total_failed += 1
+                            per_section[section_name]['failed'] += 1
+                        if row:
+                            to_insert.append(row)
+                            logger.debug(f"📝 [{section_name}] 待写入: {row['title'][:40]}...")
+
                     try:
-                        # v1.5.3: [根本修复] 详情采集强制使用线程池模式
-                        # 原因：async + curl_cffi 在某些网络条件下会进入无法恢复的死锁
-                        # 线程池虽然慢一点，但绝对不会卡死
-                        force_thread_mode = config_manager.get('FORCE_THREAD_DETAIL_CRAWL', True)
-                        
-                        if crawler_mode == 'async' and not force_thread_mode:
-                            # 仅在用户明确禁用强制线程模式时才使用异步
-                            logger.warning(f"⚠️ [{section_name}] 使用异步模式采集详情（可能存在卡死风险）")
-                            max_c = config_manager.get('CRAWLER_MAX_CONCURRENCY', 20)
-                            p_a = sht.proxies.get('http') if sht.proxies else None
-                            c_a = sht.cookie if hasattr(sht, 'cookie') else {'_safe': ''}
-                            
-                            batch_start_time = time.time()
-                            logger.info(f"📡 [{section_name}] 开始异步批量采集 {len(m_urls)} 个详情页...")
-                            
-                            async def fetch_details():
-                                async with AsyncSHTCrawler(max_connections=max_c, proxy=p_a, cookies=c_a) as c:
-                                    return await c.crawl_details_batch(m_urls)
-                            
-                            detail_timeout = min(120, len(m_urls) * 10)
-                            
-                            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                                future = executor.submit(run_async, fetch_details(), detail_timeout)
-                                poll_start = time.time()
-                                task_abandoned = False
-                                
-                                while True:
-                                    if stop_event.is_set() or check_stop_and_pause():
-                                        logger.warning(f"🛑 [{section_name}] 详情采集期间检测到停止信号，放弃本批次")
-                                        stop_event.set()
-                                        task_abandoned = True
-                                        m_results = [None] * len(m_urls)
-                                        break
-                                    
-                                    try:
-                                        m_results = future.result(timeout=0.5)
-                                        batch_elapsed = time.time() - batch_start_time
-                                        logger.info(f"✅ [{section_name}] 批量采集完成，耗时 {batch_elapsed:.1f}秒")
-                                        break
-                                    except concurrent.futures.TimeoutError:
-                                        elapsed = time.time() - poll_start
-                                        if int(elapsed) % 10 == 0 and int(elapsed) > 0:
-                                            logger.info(f"⏳ [{section_name}] 详情采集进行中... 已等待 {int(elapsed)}秒")
-                                        if elapsed > detail_timeout:
-                                            logger.error(f"🔴 [{section_name}] 详情采集超时 (>{detail_timeout}s)，放弃本批次")
+                        # 整个批次共享一个应用上下文，新增记录在批次末尾统一提交
+                        with get_flask_app_context().app_context():
+                            # v1.5.3: [根本修复] 详情采集强制使用线程池模式
+                            # 原因：async + curl_cffi 在某些网络条件下会进入无法恢复的死锁
+                            # 线程池虽然慢一点，但绝对不会卡死
+                            if crawler_mode == 'async' and not force_thread_mode:
+                                # 仅在用户明确禁用强制线程模式时才使用异步
+                                logger.warning(f"⚠️ [{section_name}] 使用异步模式采集详情（可能存在卡死风险）")
+                                p_a = sht.proxies.get('http') if sht.proxies else None
+                                c_a = sht.cookie if hasattr(sht, 'cookie') else {'_safe': ''}
+
+                                batch_start_time = time.time()
+                                logger.info(f"📡 [{section_name}] 开始异步流式采集 {len(m_urls)} 个详情页...")
+
+                                # 详情页逐个到达后放入队列，主线程边收边处理，无需等待最慢的请求
+                                detail_q = queue.Queue()
+
+                                async def fetch_details():
+                                    async with AsyncSHTCrawler(max_connections=max_c, proxy=p_a, cookies=c_a) as c:
+                                        async for d_idx, d_data in c.crawl_details_stream(m_urls):
+                                            detail_q.put((d_idx, d_data))
+
+                                detail_timeout = min(120, len(m_urls) * 10)
+
+                                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                                    future = executor.submit(run_async, fetch_details(), detail_timeout)
+                                    poll_start = time.time()
+                                    task_abandoned = False
+
+                                    while len(handled) < len(m_urls):
+                                        if fast_check_stop():
+                                            logger.warning(f"🛑 [{section_name}] 详情采集期间检测到停止信号，放弃本批次")
+                                            stop_event.set()
                                             task_abandoned = True
-                                            m_results = [None] * len(m_urls)
                                             break
-                                        continue
-                                    except Exception as e:
-                                        logger.error(f"❌ [{section_name}] 详情采集异常: {e}")
-                                        m_results = [None] * len(m_urls)
-                                        break
-                                
-                                if task_abandoned:
-                                    logger.debug(f"⏳ 等待后台线程响应停止信号...")
-                                    try:
-                                        future.result(timeout=2.0)
-                                    except:
-                                        logger.debug(f"⚠️ 后台线程未在2秒内退出，继续主流程")
-                        else:
-                            # v1.5.3: 默认使用线程池同步模式（稳定可靠）
-                            logger.info(f"🔧 [{section_name}] 使用线程池模式采集 {len(m_urls)} 个详情页（稳定模式）")
-                            m_results = sht.crawler_details_batch(m_urls, use_batch_mode=True)
-                        
-                        # --- 步骤 4: 保存结果 ---
-                        for idx, data in enumerate(m_results):
-                            if idx % 5 == 0 and check_stop_and_pause(): break
-                            
-                            tid, u_d = batch_tasks[idx]
-                            if not data or not data.get('magnet'):
-                                reason = "解析失败" if not data else "无磁力链接"
-                                if FailedTID.add(tid=tid, section=section_name, url=u_d, reason=reason):
-                                    total_failed += 1
-                                    per_section[section_name]['failed'] += 1
-                                    logger.debug(f"⚠️ {tid} 进入重试列表")
-                                continue
 
-                            # 日期过滤
-                            pub = (data.get('publish_date') or '').strip()
-                            if date_mode == 'day' and date_value and pub != date_value: continue
-                            if date_mode == 'month' and date_value and not pub.startswith(date_value): continue
+                                        try:
+                                            d_idx, d_data = detail_q.get(timeout=0.5)
+                                        except queue.Empty:
+                                            if future.done():
+                                                # 生成器提前结束（停止标志或异常），未到达的详情按失败处理
+                                                try:
+                                                    future.result()
+                                                except Exception as e:
+                                                    logger.error(f"❌ [{section_name}] 详情采集异常: {e}")
+                                                break
+                                            elapsed = time.time() - poll_start
+                                            if int(elapsed) % 10 == 0 and int(elapsed) > 0:
+                                                logger.info(f"⏳ [{section_name}] 详情采集进行中... 已等待 {int(elapsed)}秒 ({len(handled)}/{len(m_urls)})")
+                                            if elapsed > detail_timeout:
+                                                logger.error(f"🔴 [{section_name}] 详情采集超时 (>{detail_timeout}s)，放弃剩余 {len(m_urls) - len(handled)} 个详情")
+                                                task_abandoned = True
+                                                break
+                                            continue
 
-                            with get_flask_app_context().app_context():
-                                if sht.save_to_db(data, section_name, tid, u_d):
-                                    total_saved += 1
-                                    per_section[section_name]['saved'] += 1
-                                    try: FailedTID.mark_success(tid)
-                                    except: pass
-                                    logger.info(f"✅ [{section_name}] 新增: {data.get('title', '')[:40]}...")
+                                        m_results[d_idx] = d_data
+                                        collect_detail(d_idx, d_data)
+                                    else:
+                                        batch_elapsed = time.time() - batch_start_time
+                                        logger.info(f"✅ [{section_name}] 流式采集完成，耗时 {batch_elapsed:.1f}秒")
+
+                                    if task_abandoned:
+                                        logger.debug(f"⏳ 等待后台线程响应停止信号...")
+                                        try:
+                                            future.result(timeout=2.0)
+                                        except:
+                                            logger.debug(f"⚠️ 后台线程未在2秒内退出，继续主流程")
+                            else:
+                                # v1.5.3: 默认使用线程池同步模式（稳定可靠）
+                                logger.info(f"🔧 [{section_name}] 使用线程池模式采集 {len(m_urls)} 个详情页（稳定模式）")
+                                m_results = sht.crawler_details_batch(m_urls, use_batch_mode=True)
+
+                            # --- 步骤 4: 保存结果 ---
+                            # 未在流式阶段处理的结果（线程池模式全部、异步模式超时或异常后的剩余部分）在此补齐
+                            for idx, data in enumerate(m_results):
+                                if idx in handled: continue
+                                if fast_check_stop(): break
+                                collect_detail(idx, data)
+
+                            if to_insert:
+                                batch_saved = _commit_resource_batch(to_insert)
+                                if batch_saved is None:
+                                    total_failed += len(to_insert)
+                                    per_section[section_name]['failed'] += len(to_insert)
+                                    logger.warning(f"⚠️ [{section_name}] 本批次 {len(to_insert)} 个资源保存失败，已加入重试列表")
                                 else:
-                                    total_skipped += 1
-                                    per_section[section_name]['skipped'] += 1
+                                    total_saved += batch_saved
+                                    per_section[section_name]['saved'] += batch_saved
+                                    total_skipped += len(to_insert) - batch_saved
+                                    per_section[section_name]['skipped'] += len(to_insert) - batch_saved
+                                    logger.info(f"✅ [{section_name}] 本批次新增 {batch_saved}/{len(to_insert)} 个资源")
                     except Exception as e:
                         logger.error(f"❌ 详情批量采集逻辑异常: {e}")
 
@@ -1005,12 +1185,17 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                 processed_in_batch = len(batch_indices)
                 i += processed_in_batch
                 
-                update_crawl_state({
-                    'total_saved': total_saved,
-                    'total_skipped': total_skipped,
-                    'total_failed': total_failed,
-                    'processed_pages': resume_offset + i
-                })
+                now_m = time.monotonic()
+                if (reached_boundary or i >= len(pages_to_process)
+                        or now_m - last_state_update >= STATE_UPDATE_MIN_INTERVAL):
+                    update_crawl_state({
+                        **pending_state,
+                        'total_saved': total_saved,
+                        'total_skipped': total_skipped,
+                        'total_failed': total_failed,
+                        'processed_pages': resume_offset + i
+                    })
+                    last_state_update = now_m
 
                 if reached_boundary:
                     logger.info(f"🏁 [{section_name}] 增量同步完成")
@@ -1020,13 +1205,13 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                     delay = random.uniform(2, 5)
                     if sleep_interruptible(delay): break
                 
-                if total_failed >= config_manager.get('GLOBAL_ERROR_THRESHOLD', 300):
+                if total_failed >= error_threshold:
                     logger.error("🛑 全局错误过多，终止板块任务")
                     stop_event.set()
                     break
             sections_done = crawl_progress.get('sections_done', 0) + 1
             update_crawl_state({'sections_done': sections_done})
-            sync_crawl_state()
+            sync_crawl_state(force=True)
             logger.info(f"✅ 分类 [{section_name}] 爬取完成 - 新增: {per_section[section_name]['saved']}, 跳过: {per_section[section_name]['skipped']}")
         
         logger.info(f"🎉 筛选爬取完成 - 总计新增: {total_saved}, 总计跳过: {total_skipped}")
@@ -1039,162 +1224,182 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
             logger.info(f"🔄 正在对 {len(failed_pages_list)} 个失败任务进行最终重试...")
             update_crawl_state({'message': f'正在重试 {len(failed_pages_list)} 个页面...'})
             
-            for fail_item in list(failed_pages_list):
+            # 失败页按批次并发重新获取 TID 列表，每批次的详情只采集一次
+            retry_batch_size = 5 if config_manager.get('CRAWLER_MODE', 'async').lower() == 'async' else 1
+            pending_retry = list(failed_pages_list)
+            # v1.4.9: 使用标志位控制外层循环退出
+            should_stop_retry = False
+
+            for r_start in range(0, len(pending_retry), retry_batch_size):
                 if stop_event.is_set() or check_stop_and_pause():
                     break
-                
-                f_sect = fail_item['section_name']
-                f_page = fail_item['page']
-                f_url = fail_item['url']
-                
-                logger.info(f"🔄 重试 [{f_sect}] 第{f_page}页: {f_url}")
-                retry_stats['attempted'] += 1
-                
+
+                chunk = pending_retry[r_start:r_start + retry_batch_size]
+                retry_stats['attempted'] += len(chunk)
+                for fail_item in chunk:
+                    logger.info(f"🔄 重试 [{fail_item['section_name']}] 第{fail_item['page']}页: {fail_item['url']}")
+
                 # 更新UI状态显示当前正在重试
                 update_crawl_state({
-                    'message': f'正在重试 [{f_sect}] 第{f_page}页...',
-                    'current_section': f_sect,
-                    'current_page_actual': f_page,
+                    'message': f"正在重试 [{chunk[0]['section_name']}] 第{chunk[0]['page']}页 等 {len(chunk)} 个页面...",
+                    'current_section': chunk[0]['section_name'],
+                    'current_page_actual': chunk[0]['page'],
                     'total_saved': total_saved,
                     'total_skipped': total_skipped
                 })
-                
-                # v1.4.9: 使用标志位控制外层循环退出
-                should_stop_retry = False
-                
+
                 try:
                     # v1.4.3b: 扫尾重试也加入观察延迟和中断检查
-                    if sleep_interruptible(random.uniform(2, 4)): 
+                    if sleep_interruptible(random.uniform(2, 4)):
                         should_stop_retry = True
-                    
+
                     if not should_stop_retry:
                         # v1.4.8: [关键] 网络操作前再次检查停止信号
                         if stop_event.is_set() or check_stop_and_pause():
                             logger.info(f"🛑 检测到停止信号，终止重试循环")
                             should_stop_retry = True
-                    
+
                     if not should_stop_retry:
-                        # 同步获取 TID 列表
-                        tid_list = sht.crawler_tid_list(f_url)
-                        
+                        chunk_urls = [item['url'] for item in chunk]
+                        if retry_batch_size > 1:
+                            tid_lists = _burst_fetch_tid_lists(sht, chunk_urls)
+                        else:
+                            tid_lists = [sht.crawler_tid_list(chunk_urls[0]) or []]
+
                         # v1.4.8: 网络操作后立即检查
                         if stop_event.is_set() or check_stop_and_pause():
                             logger.info(f"🛑 TID获取完成后检测到停止信号")
                             should_stop_retry = True
-                    
-                    if not should_stop_retry and tid_list:
-                        retry_stats['successful'] += 1
-                        
-                        # 更新页面统计：从原本的失败列表移除，后续记录成功
-                        for idx_f, f_p in enumerate(page_stats['failed_pages']):
-                            if f_p['section'] == f_sect and f_p['page'] == f_page:
-                                page_stats['failed_pages'].pop(idx_f)
-                                page_stats['total_pages_failed'] -= 1
-                                break
-                        
-                        with get_flask_app_context().app_context():
-                            existing_tids = db.session.query(Resource.tid).filter(Resource.tid.in_(tid_list)).all()
-                            ex_set = {t[0] for t in existing_tids}
-                        
-                        to_crawl = []
-                        f_cnt_retry = 0
-                        for tid in tid_list:
-                            if tid not in ex_set:
-                                to_crawl.append((tid, f"https://sehuatang.org/forum.php?mod=viewthread&tid={tid}"))
-                            else:
-                                total_skipped += 1
-                                per_section[f_sect]['skipped'] += 1
-                                retry_stats['skipped'] += 1
-                                f_cnt_retry += 1
-                        
-                        if f_cnt_retry > 0:
-                            logger.info(f"🔍 [{f_sect}] 第{f_page}页 (重试) 过滤掉 {f_cnt_retry} 个数据库已有资源")
-                        
-                        p_saved = 0
-                        if to_crawl and not should_stop_retry:
-                            # v1.4.8: 批量采集前的最后检查
+
+                    # 本批次重新获取成功的页面，及其待采集详情 (tid, url, 页面下标)
+                    recovered = []
+                    to_crawl = []
+                    if not should_stop_retry:
+                        for fail_item, tid_list in zip(chunk, tid_lists):
+                            f_sect = fail_item['section_name']
+                            f_page = fail_item['page']
+                            if not tid_list:
+                                logger.warning(f"❌ [{f_sect}] 第{f_page}页 重试仍未获取到列表")
+                                retry_stats['failed'] += 1
+                                continue
+
+                            retry_stats['successful'] += 1
+
+                            # 更新页面统计：从原本的失败列表移除，后续记录成功
+                            for idx_f, f_p in enumerate(page_stats['failed_pages']):
+                                if f_p['section'] == f_sect and f_p['page'] == f_page:
+                                    page_stats['failed_pages'].pop(idx_f)
+                                    page_stats['total_pages_failed'] -= 1
+                                    break
+
+                            recovered.append((fail_item, tid_list))
+
+                        # 整个批次的已入库检查合并为一次查询
+                        if recovered:
+                            with get_flask_app_context().app_context():
+                                ex_set = _query_existing_tids({t for _, tl in recovered for t in tl})
+
+                        for page_pos, (fail_item, tid_list) in enumerate(recovered):
+                            f_sect = fail_item['section_name']
+                            f_page = fail_item['page']
+                            f_cnt_retry = 0
+                            for tid in tid_list:
+                                if tid not in ex_set:
+                                    to_crawl.append((tid, f"https://sehuatang.org/forum.php?mod=viewthread&tid={tid}", page_pos))
+                                else:
+                                    total_skipped += 1
+                                    per_section[f_sect]['skipped'] += 1
+                                    retry_stats['skipped'] += 1
+                                    f_cnt_retry += 1
+
+                            if f_cnt_retry > 0:
+                                logger.info(f"🔍 [{f_sect}] 第{f_page}页 (重试) 过滤掉 {f_cnt_retry} 个数据库已有资源")
+
+                    saved_by_page = {}
+                    if to_crawl and not should_stop_retry:
+                        # v1.4.8: 批量采集前的最后检查
+                        if stop_event.is_set() or check_stop_and_pause():
+                            logger.info(f"🛑 详情采集前检测到停止信号，跳过剩余 {len(to_crawl)} 个资源")
+                            should_stop_retry = True
+
+                        if not should_stop_retry:
+                            # 使用线程池并发采集本批次所有页面的详情
+                            res = sht.crawler_details_batch([u for _, u, _ in to_crawl], use_batch_mode=True)
+
+                            # v1.4.8: 批量采集完成后立即检查
                             if stop_event.is_set() or check_stop_and_pause():
-                                logger.info(f"🛑 详情采集前检测到停止信号，跳过剩余 {len(to_crawl)} 个资源")
+                                logger.info(f"🛑 详情采集完成后检测到停止信号，不保存结果")
                                 should_stop_retry = True
-                            
-                            if not should_stop_retry:
-                                b_urls = [u for t, u in to_crawl]
-                                # 使用线程池并发采集详情
-                                res = sht.crawler_details_batch(b_urls, use_batch_mode=True)
-                                
-                                # v1.4.8: 批量采集完成后立即检查
-                                if stop_event.is_set() or check_stop_and_pause():
-                                    logger.info(f"🛑 详情采集完成后检测到停止信号，不保存结果")
-                                    should_stop_retry = True
-                                
-                                if not should_stop_retry:
-                                    for idx, d in enumerate(res):
-                                        # 每 5 个检查一次
-                                        if idx % 5 == 0:
-                                            if stop_event.is_set() or check_stop_and_pause():
-                                                logger.info(f"🛑 保存过程中检测到停止信号，已保存 {idx}/{len(res)} 个")
-                                                should_stop_retry = True
-                                                break
-                                        
-                                        if should_stop_retry:
-                                            break
-                                            
-                                        tid_r, url_r = to_crawl[idx]
-                                        
-                                        # v1.4.4: 对齐主循环逻辑
-                                        if not d or not d.get('magnet'):
-                                            reason = "重试解析失败" if not d else "重试无磁力链接"
-                                            if FailedTID.add(tid=tid_r, section=f_sect, url=url_r, reason=reason):
-                                                total_failed += 1
-                                                per_section[f_sect]['failed'] += 1
-                                            continue
 
-                                        # 日期过滤 (重要：防止重试救回了不符合日期要求的资源)
-                                        pub = (d.get('publish_date') or '').strip()
-                                        if date_mode == 'day' and date_value and pub != date_value: continue
-                                        if date_mode == 'month' and date_value and not pub.startswith(date_value): continue
-
-                                        with get_flask_app_context().app_context():
-                                            if sht.save_to_db(d, f_sect, tid_r, url_r):
-                                                total_saved += 1
-                                                per_section[f_sect]['saved'] += 1
-                                                retry_stats['saved'] += 1
-                                                p_saved += 1
-                                                logger.info(f"✅ [{f_sect}] 新增 (重试): {d.get('title', '')[:40]}...")
-                                                try: FailedTID.mark_success(tid_r)
-                                                except: pass
-                                            else:
-                                                total_skipped += 1
-                                                per_section[f_sect]['skipped'] += 1
-                                                retry_stats['skipped'] += 1
-                        
                         if not should_stop_retry:
+                            with get_flask_app_context().app_context():
+                                rows_by_page = {}
+                                for idx, ((tid_r, url_r, page_pos), d) in enumerate(zip(to_crawl, res)):
+                                    # 每 5 个检查一次
+                                    if idx % 5 == 0:
+                                        if fast_check_stop():
+                                            logger.info(f"🛑 保存过程中检测到停止信号，已处理 {idx}/{len(res)} 个")
+                                            should_stop_retry = True
+                                            break
+
+                                    f_sect = recovered[page_pos][0]['section_name']
+
+                                    # v1.4.4: 对齐主循环逻辑 (日期过滤防止重试救回了不符合日期要求的资源)
+                                    row, failed = _prepare_detail_row(sht, d, f_sect, tid_r, url_r, date_filter, reason_prefix='重试')
+                                    if failed:
+                                        total_failed += 1
+                                        per_section[f_sect]['failed'] += 1
+                                    if row:
+                                        rows_by_page.setdefault(page_pos, []).append(row)
+
+                                # 按页面分别提交，便于统计每页的新增数
+                                for page_pos, rows in rows_by_page.items():
+                                    f_sect = recovered[page_pos][0]['section_name']
+                                    p_saved = _commit_resource_batch(rows)
+                                    if p_saved is None:
+                                        total_failed += len(rows)
+                                        per_section[f_sect]['failed'] += len(rows)
+                                        logger.warning(f"⚠️ [{f_sect}] 重试结果 {len(rows)} 个资源保存失败，已加入重试列表")
+                                        continue
+                                    p_dup = len(rows) - p_saved
+                                    saved_by_page[page_pos] = p_saved
+                                    total_saved += p_saved
+                                    per_section[f_sect]['saved'] += p_saved
+                                    retry_stats['saved'] += p_saved
+                                    total_skipped += p_dup
+                                    per_section[f_sect]['skipped'] += p_dup
+                                    retry_stats['skipped'] += p_dup
+                                    logger.info(f"✅ [{f_sect}] 新增 (重试) {p_saved}/{len(rows)} 个资源")
+
+                    if not should_stop_retry:
+                        for page_pos, (fail_item, tid_list) in enumerate(recovered):
+                            p_saved = saved_by_page.get(page_pos, 0)
                             page_stats['successful_pages'].append({
-                                'section': f_sect, 'page': f_page, 'saved': p_saved, 
+                                'section': fail_item['section_name'], 'page': fail_item['page'], 'saved': p_saved,
                                 'skipped': len(tid_list) - p_saved, 'is_retry': True
                             })
                             page_stats['total_pages_successful'] += 1
                             if fail_item in crawl_progress['failed_pages']:
                                 crawl_progress['failed_pages'].remove(fail_item)
-                                
+                                mark_crawl_state_dirty()
+
                 except Exception as e:
                     logger.warning(f"❌ 重试仍失败: {e}")
-                    retry_stats['failed'] += 1
-                
+                    retry_stats['failed'] += len(chunk)
+
                 # v1.4.9: 检查是否需要终止整个重试循环
                 if should_stop_retry:
                     logger.info(f"🛑 重试循环因停止信号而终止")
                     break
             
             update_crawl_state({'total_saved': total_saved})
-            sync_crawl_state()
+            sync_crawl_state(force=True)
     
         # 判断任务完成状态
         completion_status = "爬取完成"  # 默认
         exception_reason = None
     
         # 检查是否被手动停止
-        from .utils import check_stop_and_pause
         if stop_event.is_set() or check_stop_and_pause():
             completion_status = "手动终止"
         elif total_failed > 0 and (total_saved + total_skipped) == 0:
@@ -1203,9 +1408,8 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
     
         # 清除所有相关缓存，确保数据立即可见
         try:
-            from cache_manager import cache_manager, CacheKeys
-            cache_manager.delete(CacheKeys.STATS)  # 清除统计缓存
-            cache_manager.delete(CacheKeys.CATEGORIES)  # 清除分类缓存
+            from cache_manager import cache_manager
+            cache_manager.invalidate_data()  # 清除统计与分类缓存
             logger.info("✅ 已清除统计和分类缓存，新数据将立即可见")
         except Exception as e:
             logger.warning(f"清除缓存失败: {e}")
@@ -1216,9 +1420,9 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
         # 计算爬取时长
         end_time = time.time()
         start_time = crawl_progress.get('start_time', end_time)  # 如果没有开始时间，使用结束时间
-        duration_seconds = int(end_time - start_time)
-        duration_minutes = duration_seconds // 60
-        duration_seconds_remainder = duration_seconds % 60
+        # 总秒数是唯一来源，分/秒仅用于展示
+        duration_total = int(end_time - start_time)
+        duration_minutes, duration_seconds_remainder = divmod(duration_total, 60)
         
         # 构建爬取条件描述
         conditions = []
@@ -1277,36 +1481,38 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
         }
         
         # 按板块分组的页面统计
-        section_page_stats = {}
-        for page_info in page_stats['successful_pages']:
-            section = page_info['section']
-            if section not in section_page_stats:
-                section_page_stats[section] = {
-                    'successful_pages': [],
-                    'total_pages': 0,
-                    'total_saved': 0,
-                    'total_skipped': 0
-                }
-            section_page_stats[section]['successful_pages'].append(page_info['page'])
-            section_page_stats[section]['total_pages'] += 1
-            section_page_stats[section]['total_saved'] += page_info['saved']
-            section_page_stats[section]['total_skipped'] += page_info['skipped']
+        section_page_stats = defaultdict(_new_section_page_stat)
+        for pi in page_stats['successful_pages']:
+            section, page, saved, skipped = pi['section'], pi['page'], pi['saved'], pi['skipped']
+            stat = section_page_stats[section]
+            stat['successful_pages'].append(page)
+            stat['total_pages'] += 1
+            stat['total_saved'] += saved
+            stat['total_skipped'] += skipped
         
-        for page_info in page_stats['failed_pages']:
-            section = page_info['section']
-            if section not in section_page_stats:
-                section_page_stats[section] = {
-                    'successful_pages': [],
-                    'failed_pages': [],
-                    'total_pages': 0,
-                    'total_saved': 0,
-                    'total_skipped': 0
-                }
-            if 'failed_pages' not in section_page_stats[section]:
-                section_page_stats[section]['failed_pages'] = []
-            section_page_stats[section]['failed_pages'].append(page_info['page'])
-            section_page_stats[section]['total_pages'] += 1
+        for pi in page_stats['failed_pages']:
+            stat = section_page_stats[pi['section']]
+            stat['failed_pages'].append(pi['page'])
+            stat['total_pages'] += 1
+        section_page_stats = dict(section_page_stats)
         
+        # 引擎配置只读取一次，按模式取对应的并发与延迟参数
+        engine_mode = config_manager.get('CRAWLER_MODE', 'async')
+        if engine_mode == 'async':
+            engine_concurrency = config_manager.get('CRAWLER_MAX_CONCURRENCY', 20)
+            engine_delay_min = config_manager.get('CRAWLER_ASYNC_DELAY_MIN', 0.5)
+            engine_delay_max = config_manager.get('CRAWLER_ASYNC_DELAY_MAX', 1.5)
+        else:
+            engine_concurrency = config_manager.get('CRAWLER_THREAD_COUNT', 10)
+            engine_delay_min = config_manager.get('CRAWLER_SYNC_DELAY_MIN', 0.3)
+            engine_delay_max = config_manager.get('CRAWLER_SYNC_DELAY_MAX', 0.8)
+
+        # 汇总用的总数与分母只计算一次
+        total_processed = total_saved + total_skipped + total_failed
+        denom_rate = max(1, total_processed)
+        denom_item = max(1, total_saved + total_skipped)
+        denom_min = max(1, duration_total / 60)
+
         summary = {
             'timestamp': datetime.now().isoformat(),
             'unix_time': int(time.time()),
@@ -1314,14 +1520,14 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
             'completion_status': completion_status, 
             'exception_reason': exception_reason,
             'engine_set': {
-                'mode': config_manager.get('CRAWLER_MODE', 'async'),
-                'concurrency': config_manager.get('CRAWLER_MAX_CONCURRENCY', 20) if config_manager.get('CRAWLER_MODE') == 'async' else config_manager.get('CRAWLER_THREAD_COUNT', 10),
-                'delay_min': config_manager.get('CRAWLER_ASYNC_DELAY_MIN', 0.5) if config_manager.get('CRAWLER_MODE') == 'async' else config_manager.get('CRAWLER_SYNC_DELAY_MIN', 0.3),
-                'delay_max': config_manager.get('CRAWLER_ASYNC_DELAY_MAX', 1.5) if config_manager.get('CRAWLER_MODE') == 'async' else config_manager.get('CRAWLER_SYNC_DELAY_MAX', 0.8),
+                'mode': engine_mode,
+                'concurrency': engine_concurrency,
+                'delay_min': engine_delay_min,
+                'delay_max': engine_delay_max,
                 'proxy_active': bool(getattr(sht, 'proxies', {}).get('http'))
             },
             'duration': {
-                'total_seconds': duration_seconds + duration_minutes * 60,
+                'total_seconds': duration_total,
                 'minutes': duration_minutes,
                 'seconds': duration_seconds_remainder,
                 'formatted': f"{duration_minutes}分{duration_seconds_remainder}秒" if duration_minutes > 0 else f"{duration_seconds_remainder}秒"
@@ -1330,12 +1536,12 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
                 'total_saved': total_saved,
                 'total_skipped': total_skipped,
                 'total_failed': total_failed,
-                'total_processed': total_saved + total_skipped + total_failed,
-                'success_rate': round((total_saved / max(1, total_saved + total_skipped + total_failed)) * 100, 1)
+                'total_processed': total_processed,
+                'success_rate': (total_saved * 1000 // denom_rate) / 10.0
             },
             'crawl_conditions': {
                 'description': ' | '.join(conditions),
-                'target_sections': section_fids or list(SECTION_MAP.keys()),
+                'target_sections': section_fids or list(_ALL_SECTION_FIDS),
                 'max_pages_per_section': max_pages,
                 'actual_pages_crawled': actual_pages_crawled,
                 'date_filter': {
@@ -1348,8 +1554,8 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
             'section_page_breakdown': section_page_stats,
             'per_section_results': per_section,
             'performance': {
-                'avg_time_per_item': round((duration_seconds + duration_minutes * 60) / max(1, total_saved + total_skipped), 2),
-                'items_per_minute': round((total_saved + total_skipped) / max(1, (duration_seconds + duration_minutes * 60) / 60), 1)
+                'avg_time_per_item': round(duration_total / denom_item, 2),
+                'items_per_minute': round((total_saved + total_skipped) / denom_min, 1)
             },
             'raw_options': {
                 'fids': section_fids,
@@ -1361,12 +1567,14 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
         }
     
         try:
-            from configuration import Config
-            summary_json_path = Config.get_path('summary_json')
-            log_dir = Config.get_path('log_dir')
-            os.makedirs(log_dir, exist_ok=True)
-            with open(summary_json_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, ensure_ascii=False, indent=2)
+            summary_json_path = _SUMMARY_JSON_PATH
+            global _LOG_DIR_READY
+            if not _LOG_DIR_READY:
+                os.makedirs(_LOG_DIR, exist_ok=True)
+                _LOG_DIR_READY = True
+            # 页面明细过多时改为流式写入，避免整体序列化占用大量内存
+            page_entries = sum(len(st['successful_pages']) + len(st['failed_pages']) for st in section_page_stats.values())
+            _dump_json(summary, summary_json_path, stream=page_entries > SUMMARY_STREAM_PAGE_THRESHOLD)
             logger.info(f"📊 详细爬取摘要已保存到 {summary_json_path}")
             logger.info(f"📊 爬取耗时: {summary['duration']['formatted']}, 平均每项: {summary['performance']['avg_time_per_item']}秒")
         except Exception as e:
@@ -1381,8 +1589,6 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
 
         # 通知状态机回到idle状态
         try:
-            from crawler_control.cc_control_bridge import get_crawler_control_bridge
-            bridge = get_crawler_control_bridge()
             bridge.coordinator.transition_state('idle', {'stopped_at': time.time()})
             logger.info("✅ 已通知状态机：爬虫回到idle状态")
         except Exception as e:
@@ -1413,30 +1619,27 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
             'current_page_task': 0,
             'max_pages_task': 0
         })
-        sync_crawl_state()
+        sync_crawl_state(force=True)
     
         # Task completed successfully (continue to summary and final status)
 
     except Exception as e:
-        import traceback
-        logger.error(f"❌ 爬虫任务异常: {traceback.format_exc()}")
+        logger.error("❌ 爬虫任务异常", exc_info=True)
 
         # 即使异常也要发送通知
         try:
-            error_msg = f"""❌ *爬虫任务异常终止*
-━━━━━━━━━━━━━━
-⚠️ 错误信息：{str(e)[:200]}
-⏰ 终止时间：{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-💡 建议：检查日志获取详细信息"""
+            error_msg = _CRAWL_EXCEPTION_TMPL.format(
+                err=str(e)[:200],
+                ts=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            )
             _send_telegram_message(error_msg, parse_mode='Markdown')
         except Exception as notify_err:
             logger.error(f"发送异常通知失败: {notify_err}")
         
         # 清理状态
         try:
-            from crawler_control.cc_control_bridge import get_crawler_control_bridge
-            bridge = get_crawler_control_bridge()
-            bridge.reset_to_idle()
+            if bridge is not None:
+                bridge.reset_to_idle()
         except:
             pass
         
@@ -1452,16 +1655,12 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
 
             # 无论正常还是异常退出，都发送完成通知
             try:
-                from crawler_control.cc_control_bridge import get_crawler_control_bridge
-
-                # 读取保存的摘要文件（如果存在）
-                from configuration import Config
-                summary_json_path = Config.get_path('summary_json')
-
-                summary_data = {}
-                if os.path.exists(summary_json_path):
-                    with open(summary_json_path, 'r', encoding='utf-8') as f:
-                        summary_data = json.load(f)
+                # 优先使用内存中的摘要，仅在摘要尚未生成时读取保存的摘要文件
+                summary_data = summary
+                if summary_data is None:
+                    summary_json_path = _SUMMARY_JSON_PATH
+                    if os.path.exists(summary_json_path):
+                        summary_data = _load_json(summary_json_path)
 
                 # 如果有摘要数据，发送报告
                 if summary_data and summary_data.get('results'):
@@ -1473,11 +1672,13 @@ def run_crawling_with_options(section_fids=None, date_mode=None, date_value=None
 
                 # 强制更新状态为空闲
                 try:
-                    bridge = get_crawler_control_bridge()
-                    bridge.reset_to_idle()
-                    logger.info("✅ 已强制重置状态到空闲")
+                    if bridge is not None:
+                        bridge.reset_to_idle()
+                        logger.info("✅ 已强制重置状态到空闲")
                 except Exception as reset_err:
                     logger.warning(f"finally 块重置状态失败: {reset_err}")
 
             except Exception as notify_err:
-                logger.error(f"finally 块发送完成通知失败: {notify_err}")
\ No newline at end of file
+                logger.error(f"finally 块发送完成通知失败: {notify_err}")
+        if sources_token is not None:
+            crawl_state_sources_var.reset(sources_token)
@@ -6,14 +6,66 @@
 
 import logging
 import datetime as _dt
+import asyncio
 import json
 import os
 import re
+import string
+import functools
+import threading
 import importlib.util
+import http.client
+import weakref
+import requests
+import requests.adapters
+import httpx
 from configuration import Config
+from constants import SECTION_MAP
+from utils.retry_utils import retry_request, async_retry_request, RETRY_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# 报告中完成状态对应的 Emoji 与爬虫模式名称
+_STATUS_EMOJI = {
+    '爬取完成': '✅',
+    '手动终止': '⏹️',
+    '异常终止': '❌'
+}
+_MODE_MAP = {
+    'async': '异步并发',
+    'thread': '多线程',
+    'sync': '同步单线程'
+}
+
+# 报告中日期模式与 dateline 秒数对应的时间范围描述
+_TIME_DESC_MAP = {
+    'day': '单日',
+    '1day': '单日',
+    '2day': '近2天',
+    '3day': '近3天',
+    'week': '近1周',
+    '1week': '近1周',
+    'month': '近1月',
+    '1month': '近1月',
+    '3month': '近3月',
+    '6month': '近半年',
+    'year': '近1年',
+    '1year': '近1年'
+}
+_DATELINE_DESC_MAP = {
+    86400: '近1天',
+    604800: '近1周',
+    2592000: '近1月',
+    31536000: '近1年'
+}
+
+# fid -> 板块名，同时收录字符串与整数形式的 fid
+_SECTION_LOOKUP = {}
+for _fid, _name in SECTION_MAP.items():
+    _SECTION_LOOKUP[str(_fid)] = _name
+    if str(_fid).isdigit():
+        _SECTION_LOOKUP[int(_fid)] = _name
+
 DEFAULT_TEMPLATES = {
     "parse_mode": "MarkdownV2",
     "crawl_report": {
@@ -26,7 +78,8 @@ DEFAULT_TEMPLATES = {
         "summary_line": "📈 *爬取合计*：新增{total_saved}个，跳过重复{total_skipped}个，失败并加入重试的有{total_failed}个",
         "section_header": "*具体板块*：",
         "section_line": "• {section_name}：爬取{pages_crawled}页 新增{saved}个，跳过重复{skipped}个，失败并加入重试的有{failed}个",
-        "empty_section": "（无数据变动）"
+        "empty_section": "（无数据变动）",
+        "report_body": "{title}\n{separator}\n{status_line}{exception_line}\n{duration_line}\n{config_line}\n{summary_line}\n\n{section_header}\n{section_lines}"
     },
     "messages": {
         "initial_report": "🚀 *开始{task_type}，本次爬取配置：*\n板块：{all_boards}\n时间：{time_range}\n页数：{page_mode} \\- {page_desc}\n模式：{mode}\n\n━━━━━━━━━━━━\n📂 当前进行中的板块：{section_name}\n📄 板块 {section_name} 的实际任务页数：{actual_page_range}\n⏳ 候选中的板块：{pending_boards}",
@@ -44,15 +97,41 @@ DEFAULT_TEMPLATES = {
 }
 
 
+_FORMATTER = string.Formatter()
+
+
 class _SafeDict(dict):
     def __missing__(self, key):
         return ""
 
 
+# 把 {ctx['key']} / {ctx["key"]} 写法归一为 str.format 支持的 {ctx[key]}
+_BRACKET_NORMALIZE_RE = re.compile(r"\[['\"]([a-zA-Z0-9_]+)['\"]\]")
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_template_string_cached(template: str) -> str:
+    return _BRACKET_NORMALIZE_RE.sub(r"[\1]", template)
+
+
 def _normalize_template_string(template: str) -> str:
     if not isinstance(template, str):
         return ""
-    return re.sub(r"\[['\"]([a-zA-Z0-9_]+)['\"]\]", r"[\1]", template)
+    return _normalize_template_string_cached(template)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(template: str):
+    """把模板预解析为 (字面文本, 占位符名) 片段
+
+    占位符带格式说明、转换符或下标访问时返回 None，由调用方回退到 format_map
+    """
+    segments = []
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        segments.append((literal, field))
+    return tuple(segments)
 
 
 def _format_template(template: str, context: dict, parse_mode: str = None) -> str:
@@ -74,25 +153,47 @@ def _format_template(template: str, context: dict, parse_mode: str = None) -> st
         escaped_context = {}
         for key, value in context.items():
             if isinstance(value, str):
-                # 只转义变量值，不转义模板中已有的 Markdown 格式
-                escaped_context[key] = escape_markdown_v2(value)
+                # 只转义变量值，不转义模板中已有的 Markdown 格式；不含特殊字符的值原样使用
+                if _MDV2_SPECIALS.isdisjoint(value):
+                    escaped_context[key] = value
+                else:
+                    escaped_context[key] = _escape_markdown_v2_cached(value)
             else:
                 escaped_context[key] = value
         context = escaped_context
 
     normalized = _normalize_template_string(template)
-    return normalized.format_map(_SafeDict(context or {}))
+    segments = _compile_template(normalized)
+    if segments is None:
+        return normalized.format_map(_SafeDict(context or {}))
+
+    context = context or {}
+    return ''.join(
+        literal if name is None else literal + format(context.get(name, ''))
+        for literal, name in segments
+    )
+
+
+# 已加载的 Python 模板：path -> (mtime, templates)，文件修改后自动重新加载
+_TEMPLATE_CACHE: dict = {}
 
 
 def _load_py_templates(path: str) -> dict:
     try:
+        mtime = os.path.getmtime(path)
+        cached = _TEMPLATE_CACHE.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
         spec = importlib.util.spec_from_file_location("telegram_templates", path)
         if not spec or not spec.loader:
             return {}
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         templates = getattr(module, "TEMPLATES", None) or getattr(module, "templates", None)
-        return templates if isinstance(templates, dict) else {}
+        templates = templates if isinstance(templates, dict) else {}
+        _TEMPLATE_CACHE[path] = (mtime, templates)
+        return templates
     except Exception as e:
         logger.warning(f"⚠️ 读取Telegram模板失败（Python）: {e}")
         return {}
@@ -147,6 +248,7 @@ Telegram 通知模板（可直接编辑，保存后实时生效）
 # {saved}                  # 当前板块新增保存数量（仅 crawl_report.section_line）
 # {skipped}                # 当前板块跳过重复数量（仅 crawl_report.section_line）
 # {failed}                 # 当前板块失败数量（仅 crawl_report.section_line）
+# {section_lines}          # 全部板块明细行（仅 crawl_report.report_body）
 
 # 【错误和异常相关】
 # {error_type}             # 错误类型（如"ConnectionError"）
@@ -217,7 +319,11 @@ TEMPLATES = {
         "section_line": "• {section_name}：爬取{pages_crawled}页 新增{saved}个，跳过重复{skipped}个，失败并加入重试的有{failed}个",
 
         # 无数据变动时的提示
-        "empty_section": "（无数据变动）"
+        "empty_section": "（无数据变动）",
+
+        # 报告整体布局：占位符为上面各行模板的键名，{section_lines} 为全部板块明细行
+        # {exception_line} 已自带换行，非异常终止时为空
+        "report_body": "{title}\\n{separator}\\n{status_line}{exception_line}\\n{duration_line}\\n{config_line}\\n{summary_line}\\n\\n{section_header}\\n{section_lines}"
     },
 
     # =============================================================================
@@ -286,15 +392,28 @@ TEMPLATES = {
 
 
 def _deep_merge(base: dict, incoming: dict) -> dict:
-    for k, v in incoming.items():
-        if isinstance(v, dict) and isinstance(base.get(k), dict):
-            base[k] = _deep_merge(base.get(k, {}), v)
-        else:
-            base[k] = v
-    return base
+    """把 incoming 深度合并到 base 之上，返回新字典，不修改 base 与 incoming
 
+    未被覆盖的子字典与 base 共享，结果应视为只读
+    """
+    merged = dict(base)
+    # 显式栈代替递归：(输出字典, 对应的 base 子字典, 对应的 incoming 子字典)
+    stack = [(merged, base, incoming)]
+    while stack:
+        out, b, inc = stack.pop()
+        for k, v in inc.items():
+            if isinstance(v, dict) and isinstance(b.get(k), dict):
+                child = dict(b[k])
+                out[k] = child
+                stack.append((child, b[k], v))
+            else:
+                out[k] = v
+    return merged
 
+
+@functools.lru_cache(maxsize=1)
 def _resolve_templates_path() -> str:
+    """模板文件路径；路径配置在进程内不变，解析一次后缓存（需要时可调用 cache_clear）"""
     path = Config.get_path('telegram_templates')
     if path:
         return path
@@ -319,9 +438,60 @@ def _ensure_templates_file(path: str):
         logger.warning(f"⚠️ 创建Telegram模板文件失败: {e}")
 
 
+# 合并后的模板缓存：(模板文件签名, 模板字典)；签名由路径与相关文件的 mtime 组成
+_TEMPLATES_CACHE = None
+_TEMPLATES_CACHE_LOCK = threading.Lock()
+
+
+def _templates_signature(path: str):
+    """模板文件及其 JSON 回退文件的修改时间签名，文件不存在时对应项为 None"""
+    sig = [path]
+    for p in (path, path.replace('.py', '.json') if path.endswith('.py') else None):
+        try:
+            sig.append(os.stat(p).st_mtime_ns if p else None)
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+
 def load_telegram_templates() -> dict:
+    """读取并合并 Telegram 模板
+
+    结果按模板文件的 mtime 缓存，文件被修改后自动重新加载；返回值为共享对象，调用方不应修改
+    """
+    global _TEMPLATES_CACHE
     path = _resolve_templates_path()
-    _ensure_templates_file(path)
+    signature = _templates_signature(path)
+    if signature[1] is None:
+        _ensure_templates_file(path)
+        signature = _templates_signature(path)
+
+    cached = _TEMPLATES_CACHE
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    with _TEMPLATES_CACHE_LOCK:
+        cached = _TEMPLATES_CACHE
+        if cached and cached[0] == signature:
+            return cached[1]
+        templates = _load_telegram_templates_uncached(path)
+        _precompile_templates(templates)
+        _TEMPLATES_CACHE = (signature, templates)
+        return templates
+
+
+def _precompile_templates(templates: dict):
+    """模板重新加载时预先解析所有消息模板，后续渲染直接命中 _compile_template 缓存"""
+    for group in ('messages', 'crawl_report'):
+        for tpl in (templates.get(group) or {}).values():
+            if isinstance(tpl, str):
+                try:
+                    _compile_template(_normalize_template_string(tpl))
+                except ValueError as e:
+                    logger.warning(f"⚠️ Telegram模板格式错误: {e}")
+
+
+def _load_telegram_templates_uncached(path: str) -> dict:
     try:
         if os.path.exists(path):
             if path.endswith('.py'):
@@ -336,11 +506,12 @@ def load_telegram_templates() -> dict:
                     with open(json_path, 'r', encoding='utf-8') as f:
                         user_tpl = json.load(f)
 
-            merged = _deep_merge(json.loads(json.dumps(DEFAULT_TEMPLATES)), user_tpl or {})
+            merged = _deep_merge(DEFAULT_TEMPLATES, user_tpl or {})
             return merged
     except Exception as e:
         logger.warning(f"⚠️ 读取Telegram模板失败，使用默认模板: {e}")
-    return json.loads(json.dumps(DEFAULT_TEMPLATES))
+    # 与缓存结果一样按只读共享，无需复制
+    return DEFAULT_TEMPLATES
 
 
 def render_message_template(template_key: str, context: dict) -> tuple[str, str]:
@@ -361,15 +532,23 @@ def render_message_template(template_key: str, context: dict) -> tuple[str, str]
     return _format_template(message_tpl, context, parse_mode), parse_mode
 
 
+_MDV2_SPECIALS = frozenset(r'_*[]()~`>#+-=|{}.!')
+_MDV2_ESCAPE_TABLE = str.maketrans({c: '\\' + c for c in _MDV2_SPECIALS})
+
+
 def escape_markdown_v2(text: str) -> str:
     """转义 Telegram MarkdownV2 特殊字符"""
-    escape_chars = r'_*[]()~`>#+-=|{}.!'
-    return ''.join(f'\\{char}' if char in escape_chars else char for char in str(text))
+    return str(text).translate(_MDV2_ESCAPE_TABLE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _escape_markdown_v2_cached(text: str) -> str:
+    return escape_markdown_v2(text)
 
 
 def build_crawl_report_message(summary: dict) -> tuple[str, str]:
     templates = load_telegram_templates()
-    crawl_tpl = templates.get('crawl_report', {})
+    crawl_tpl = templates['crawl_report']
     parse_mode = templates.get('parse_mode') or 'Markdown'
 
     task_type_text = summary.get('task_type_text', '任务')
@@ -382,11 +561,7 @@ def build_crawl_report_message(summary: dict) -> tuple[str, str]:
     section_page_breakdown = summary.get('section_page_breakdown', {})
     engine_set = summary.get('engine_set', {})
 
-    status_emoji = {
-        '爬取完成': '✅',
-        '手动终止': '⏹️',
-        '异常终止': '❌'
-    }.get(completion_status, '❓')
+    status_emoji = _STATUS_EMOJI.get(completion_status, '❓')
 
     formatted_duration = duration.get('formatted', '未知')
 
@@ -396,12 +571,7 @@ def build_crawl_report_message(summary: dict) -> tuple[str, str]:
     
     # 1. 爬虫模式（异步/多线程/单线程）
     crawler_mode = engine_set.get('mode', 'async')
-    mode_map = {
-        'async': '异步并发',
-        'thread': '多线程',
-        'sync': '同步单线程'
-    }
-    mode_desc = mode_map.get(crawler_mode, crawler_mode)
+    mode_desc = _MODE_MAP.get(crawler_mode, crawler_mode)
     concurrency = engine_set.get('concurrency', 0)
     if crawler_mode == 'async' and concurrency:
         mode_desc += f" ({concurrency}并发)"
@@ -411,18 +581,12 @@ def build_crawl_report_message(summary: dict) -> tuple[str, str]:
     
     # 2. 板块信息
     if target_sections and len(target_sections) > 0:
-        from constants import SECTION_MAP
         section_names = []
         for fid in target_sections:
             # 同时支持整数和字符串类型的 fid
-            fid_str = str(fid)
-            fid_int = int(fid) if fid.isdigit() else None
-            
-            # 尝试用 fid_str 和 fid_int 匹配
-            if fid_str in SECTION_MAP:
-                section_names.append(SECTION_MAP[fid_str])
-            elif fid_int is not None and fid_int in SECTION_MAP:
-                section_names.append(SECTION_MAP[fid_int])
+            name = _SECTION_LOOKUP.get(fid) or _SECTION_LOOKUP.get(str(fid))
+            if name:
+                section_names.append(name)
         
         if section_names:
             if len(section_names) <= 3:
@@ -457,21 +621,7 @@ def build_crawl_report_message(summary: dict) -> tuple[str, str]:
     dateline = date_filter.get('dateline')
     
     if date_mode and date_mode != 'all':
-        time_desc_map = {
-            'day': '单日',
-            '1day': '单日',
-            '2day': '近2天',
-            '3day': '近3天',
-            'week': '近1周',
-            '1week': '近1周',
-            'month': '近1月',
-            '1month': '近1月',
-            '3month': '近3月',
-            '6month': '近半年',
-            'year': '近1年',
-            '1year': '近1年'
-        }
-        time_desc = time_desc_map.get(date_mode, date_mode)
+        time_desc = _TIME_DESC_MAP.get(date_mode, date_mode)
         
         if date_value:
             config_desc_parts.append(f"时间：{date_value} ({time_desc})")
@@ -481,17 +631,8 @@ def build_crawl_report_message(summary: dict) -> tuple[str, str]:
             config_desc_parts.append(f"时间：{date_mode}")
     elif dateline:
         seconds = int(dateline)
-        if seconds == 86400:
-            config_desc_parts.append("时间：近1天")
-        elif seconds == 604800:
-            config_desc_parts.append("时间：近1周")
-        elif seconds == 2592000:
-            config_desc_parts.append("时间：近1月")
-        elif seconds == 31536000:
-            config_desc_parts.append("时间：近1年")
-        else:
-            days = seconds // 86400
-            config_desc_parts.append(f"时间：近{days}天")
+        time_desc = _DATELINE_DESC_MAP.get(seconds) or f"近{seconds // 86400}天"
+        config_desc_parts.append(f"时间：{time_desc}")
     
     # 组合配置描述
     crawl_config_desc = " | ".join(config_desc_parts) if config_desc_parts else "未知配置"
@@ -508,27 +649,25 @@ def build_crawl_report_message(summary: dict) -> tuple[str, str]:
         'total_failed': results.get('total_failed', 0)
     }
 
-    msg = [
-        _format_template(crawl_tpl.get('title', '{status_emoji} *{task_type_text}完成！*'), context_base, parse_mode),
-        _format_template(crawl_tpl.get('separator', '━━━━━━━━━━━━'), context_base, parse_mode),
-        _format_template(crawl_tpl.get('status_line', '📊 *完成状态*：{completion_status}'), context_base, parse_mode)
-    ]
-
+    # 先逐行渲染，再按 report_body 布局一次性拼接
+    lines_ctx = {
+        'title': _format_template(crawl_tpl['title'], context_base, parse_mode),
+        'separator': _format_template(crawl_tpl['separator'], context_base, parse_mode),
+        'status_line': _format_template(crawl_tpl['status_line'], context_base, parse_mode),
+        'exception_line': '',
+        'duration_line': _format_template(crawl_tpl['duration_line'], context_base, parse_mode),
+        'config_line': _format_template(crawl_tpl['config_line'], context_base, parse_mode),
+        'summary_line': _format_template(crawl_tpl['summary_line'], context_base, parse_mode),
+        'section_header': _format_template(crawl_tpl['section_header'], {}, parse_mode),
+    }
     if exception_reason:
-        msg.append(_format_template(crawl_tpl.get('exception_line', '⚠️ *异常原因*：{exception_reason}'), context_base, parse_mode))
-
-    msg.append(_format_template(crawl_tpl.get('duration_line', '⏱️ *共耗时*：{duration}'), context_base, parse_mode))
-
-    msg.append(_format_template(crawl_tpl.get('config_line', '📝 *本次爬取配置*：{crawl_config_desc}'), context_base, parse_mode))
-
-    msg.append(_format_template(crawl_tpl.get('summary_line', '📈 *爬取合计*：新增{total_saved}个，跳过重复{total_skipped}个，失败并加入重试的有{total_failed}个'), context_base, parse_mode))
-
-    msg.append("")
-    msg.append(_format_template(crawl_tpl.get('section_header', '*具体板块*：'), {}, parse_mode))
+        lines_ctx['exception_line'] = "\n" + _format_template(crawl_tpl['exception_line'], context_base, parse_mode)
 
+    section_lines = []
     has_detail = False
-    for section_name in per_section.keys():
-        section_data = per_section[section_name]
+    # 板块明细共用一个上下文字典，每个板块只更新自身的字段
+    section_ctx = dict(context_base)
+    for section_name, section_data in per_section.items():
         saved = section_data.get('saved', 0)
         skipped = section_data.get('skipped', 0)
         failed = section_data.get('failed', 0)
@@ -537,26 +676,26 @@ def build_crawl_report_message(summary: dict) -> tuple[str, str]:
             pages_crawled = section_page_breakdown[section_name].get('total_pages', 0)
 
         if saved > 0 or skipped > 0 or failed > 0 or pages_crawled > 0:
-            msg.append(_format_template(crawl_tpl.get('section_line', '• {section_name}：爬取{pages_crawled}页 新增{saved}个，跳过重复{skipped}个，失败并加入重试的有{failed}个'), {
-                **context_base,
-                'section_name': section_name,
-                'pages_crawled': pages_crawled,
-                'saved': saved,
-                'skipped': skipped,
-                'failed': failed
-            }, parse_mode))
+            section_ctx['section_name'] = section_name
+            section_ctx['pages_crawled'] = pages_crawled
+            section_ctx['saved'] = saved
+            section_ctx['skipped'] = skipped
+            section_ctx['failed'] = failed
+            section_lines.append(_format_template(crawl_tpl['section_line'], section_ctx, parse_mode))
             has_detail = True
 
     if not has_detail:
-        msg.append(_format_template(crawl_tpl.get('empty_section', '（无数据变动）'), {}, parse_mode))
+        section_lines.append(_format_template(crawl_tpl['empty_section'], {}, parse_mode))
 
-    return "\n".join(msg), parse_mode
+    lines_ctx['section_lines'] = "\n".join(section_lines)
+    report_body = crawl_tpl['report_body']
+    # 各行已按 parse_mode 转义，布局本身不再转义
+    return _format_template(report_body, lines_ctx), parse_mode
 
 
 # v1.4.2 [修复] 使用全局线程池发送通知，防止网络波动阻塞爬虫主线程
 # v1.5.4 [修复] 使用守护线程池，防止程序退出时过早关闭
 import concurrent.futures
-import threading
 
 def _create_notif_pool():
     """创建通知线程池（延迟初始化）"""
@@ -568,37 +707,163 @@ def _create_notif_pool():
 _notif_pool = _create_notif_pool()
 _notif_pool_lock = threading.Lock()
 
-def _send_telegram_message(text: str, parse_mode: str = None) -> bool:
-    """发送Telegram消息 (非阻塞后台模式)"""
+# 复用到 api.telegram.org 的 keep-alive 连接，连接池大小与通知线程数一致
+_TG_SESSION = requests.Session()
+_TG_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=3))
+
+# 可丢弃消息（心跳等）同时在途的上限，Telegram 变慢时直接丢弃而不是在线程池中堆积
+DROPPABLE_MAX_INFLIGHT = 2
+_droppable_slots = threading.BoundedSemaphore(DROPPABLE_MAX_INFLIGHT)
+
+# 直连时每个通知线程持有一个到 api.telegram.org 的 HTTPSConnection，免去 requests 的封装开销
+TG_API_HOST = "api.telegram.org"
+_tg_conn_local = threading.local()
+
+
+class _TgResponse:
+    """_tg_direct_post 的最小响应对象，字段与 requests.Response 保持一致"""
+    __slots__ = ('status_code', 'text')
+
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+
+
+def _tg_direct_post(path: str, payload: dict, timeout: float = 10) -> _TgResponse:
+    """通过当前线程复用的 HTTPS 连接 POST JSON 到 Telegram API
+
+    复用的空闲连接可能已被服务端关闭，此时重建连接再试一次；
+    超时等其他错误直接抛出，交给 retry_request 按退避策略重试
+    """
+    body = json.dumps(payload).encode('utf-8')
+    headers = {'Content-Type': 'application/json'}
+    while True:
+        conn = getattr(_tg_conn_local, 'conn', None)
+        reused = conn is not None
+        if conn is None:
+            conn = http.client.HTTPSConnection(TG_API_HOST, timeout=timeout)
+            _tg_conn_local.conn = conn
+        try:
+            conn.request('POST', path, body, headers)
+            resp = conn.getresponse()
+            return _TgResponse(resp.status, resp.read().decode('utf-8', errors='replace'))
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            conn.close()
+            _tg_conn_local.conn = None
+            if not reused:
+                raise
+        except Exception:
+            conn.close()
+            _tg_conn_local.conn = None
+            raise
+
+
+# 在事件循环中发出的发送任务，保持强引用直到完成
+_async_send_tasks = set()
+
+# 每个事件循环复用一个 AsyncClient（连接池绑定所在循环）：loop -> (代理, 客户端, 生命周期生成器)
+_async_clients = weakref.WeakKeyDictionary()
+
+
+async def _async_client_lifetime(client: httpx.AsyncClient):
+    """挂起直到被关闭，随后关闭客户端
+
+    事件循环结束时 shutdown_asyncgens()（asyncio.run 收尾时自动调用）会 aclose 仍挂起的异步生成器，
+    借此在循环关闭前释放客户端的连接池
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+def _get_async_client(loop) -> httpx.AsyncClient:
+    """返回当前事件循环复用的 AsyncClient，首次使用或代理配置变化时创建（旧客户端随即关闭）"""
+    proxy = Config.PROXY or None
+    entry = _async_clients.get(loop)
+    if entry is None or entry[0] != proxy or entry[1].is_closed:
+        if entry is not None:
+            loop.create_task(entry[2].aclose())
+        client = httpx.AsyncClient(proxy=proxy, timeout=RETRY_CONFIG['telegram']['timeout'])
+        lifetime = _async_client_lifetime(client)
+        # 在该循环上启动生成器，使其登记到循环的异步生成器集合中
+        loop.create_task(lifetime.__anext__())
+        _async_clients[loop] = entry = (proxy, client, lifetime)
+    return entry[1]
+
+# 可合并消息（心跳、状态变更）：同一 coalesce_key 在窗口期内只发送最后一条
+COALESCE_WINDOW = 0.5
+_pending_coalesced = {}
+_pending_coalesced_lock = threading.Lock()
+
+
+def _flush_coalesced(key: str):
+    with _pending_coalesced_lock:
+        item = _pending_coalesced.pop(key, None)
+    if item:
+        text, parse_mode, droppable = item
+        _send_telegram_message(text, parse_mode=parse_mode, droppable=droppable)
+
+
+def _send_telegram_message(text: str, parse_mode: str = None, droppable: bool = False,
+                           coalesce_key: str = None) -> bool:
+    """发送Telegram消息 (非阻塞后台模式)
+
+    droppable=True 用于心跳等提示性消息：已有 DROPPABLE_MAX_INFLIGHT 条在途时直接丢弃
+    coalesce_key 不为空时延迟 COALESCE_WINDOW 秒发送，期间同 key 的新消息替换旧消息
+    """
     token = Config.TG_BOT_TOKEN
     chat_id = Config.TG_NOTIFY_CHAT_ID
 
     if not token or not chat_id:
         return False
 
+    if coalesce_key:
+        with _pending_coalesced_lock:
+            scheduled = coalesce_key in _pending_coalesced
+            _pending_coalesced[coalesce_key] = (text, parse_mode, droppable)
+        if not scheduled:
+            timer = threading.Timer(COALESCE_WINDOW, _flush_coalesced, args=(coalesce_key,))
+            timer.daemon = True
+            timer.start()
+        return True
+
     def _sync_send():
         try:
-            import requests
-            from utils.retry_utils import retry_request, RETRY_CONFIG
-
             url = f"https://api.telegram.org/bot{token}/sendMessage"
             payload = {'chat_id': chat_id, 'text': text}
             if parse_mode: payload['parse_mode'] = parse_mode
 
-            proxies = None
-            if Config.PROXY:
-                proxies = {'http': Config.PROXY, 'https': Config.PROXY}
-
             config = RETRY_CONFIG['telegram']
             # 这里保持原有的带重试逻辑，但在后台线程运行
-            response = retry_request(
-                requests.post,
-                url=url,
-                json=payload,
-                proxies=proxies,
-                raise_on_fail=False,
-                **config
-            )
+            if Config.PROXY:
+                # 走代理时使用 requests 会话
+                proxies = {'http': Config.PROXY, 'https': Config.PROXY}
+                response = retry_request(
+                    _TG_SESSION.post,
+                    url=url,
+                    json=payload,
+                    proxies=proxies,
+                    raise_on_fail=False,
+                    **config
+                )
+            elif requests.utils.get_environ_proxies(url):
+                # 环境变量代理 (HTTPS_PROXY/ALL_PROXY 等) 由 requests 会话按 trust_env 处理
+                response = retry_request(
+                    _TG_SESSION.post,
+                    url=url,
+                    json=payload,
+                    raise_on_fail=False,
+                    **config
+                )
+            else:
+                response = retry_request(
+                    _tg_direct_post,
+                    path=f"/bot{token}/sendMessage",
+                    payload=payload,
+                    raise_on_fail=False,
+                    **config
+                )
 
             if response and response.status_code == 200:
                 logger.info("✓ [TELEGRAM] 通知推送成功 (异步)")
@@ -611,22 +876,121 @@ def _send_telegram_message(text: str, parse_mode: str = None) -> bool:
             logger.warning(f"❌ [TELEGRAM] 异步后台发送异常: {e}")
             return False
 
-    # 🚀 立即提交任务到线程池并返回 True (表示已接受发送任务)
+    if droppable and not _droppable_slots.acquire(blocking=False):
+        logger.debug("⏭️ [TELEGRAM] 上一条提示性消息仍在发送，丢弃本条")
+        return False
+
+    async def _async_send(client):
+        url = f"https://api.telegram.org/bot{token}/sendMessage"
+        payload = {'chat_id': chat_id, 'text': text}
+        if parse_mode: payload['parse_mode'] = parse_mode
+        try:
+            response = await async_retry_request(
+                client.post,
+                url=url,
+                json=payload,
+                raise_on_fail=False,
+                **RETRY_CONFIG['telegram']
+            )
+            if response and response.status_code == 200:
+                logger.info("✓ [TELEGRAM] 通知推送成功 (事件循环)")
+                return True
+            l_code = response.status_code if response else 'N/A'
+            logger.warning(f"! [TELEGRAM] 事件循环推送失败 HTTP {l_code}")
+            return False
+        except Exception as e:
+            logger.warning(f"❌ [TELEGRAM] 事件循环发送异常: {e}")
+            return False
+
+    def _on_async_send_done(task):
+        if not task.cancelled():
+            if droppable:
+                _droppable_slots.release()
+            return
+        # 所在事件循环提前结束（如 asyncio.run 收尾）时任务可能在开始前就被取消，改由线程池补发；
+        # 可丢弃消息的名额由补发任务继续持有，完成后再释放
+        try:
+            future = _submit_to_notif_pool(_sync_send)
+        except Exception as e:
+            if droppable:
+                _droppable_slots.release()
+            logger.debug(f"⚠️ 无法补发通知任务: {e}")
+            return
+        if droppable:
+            future.add_done_callback(lambda _f: _droppable_slots.release())
+
+    # 在运行中的事件循环里调用时（如 Bot 处理函数），直接在该循环上发送，不占用通知线程
     try:
-        global _notif_pool
-        with _notif_pool_lock:
-            # v1.5.4: 如果线程池已关闭，重新创建
-            if _notif_pool._shutdown:
-                logger.debug("🔄 通知线程池已关闭，重新创建")
-                _notif_pool = _create_notif_pool()
-            
-            _notif_pool.submit(_sync_send)
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    # 🚀 立即提交任务并返回 True (表示已接受发送任务)
+    try:
+        if loop is not None:
+            task = loop.create_task(_async_send(_get_async_client(loop)))
+            _async_send_tasks.add(task)
+            task.add_done_callback(_async_send_tasks.discard)
+            task.add_done_callback(_on_async_send_done)
+        else:
+            task = _submit_to_notif_pool(_sync_send)
+            if droppable:
+                task.add_done_callback(lambda _t: _droppable_slots.release())
         return True
     except Exception as e:
+        if droppable:
+            _droppable_slots.release()
         logger.debug(f"⚠️ 无法提交通知任务: {e}")
         return False
 
 
+def _submit_to_notif_pool(fn):
+    """提交任务到通知线程池，线程池已关闭时重新创建"""
+    global _notif_pool
+    pool = _notif_pool
+    # v1.5.4: 如果线程池已关闭，重新创建（双重检查，线程池正常时无需加锁）
+    if pool._shutdown:
+        with _notif_pool_lock:
+            if _notif_pool._shutdown:
+                logger.debug("🔄 通知线程池已关闭，重新创建")
+                _notif_pool = _create_notif_pool()
+            pool = _notif_pool
+    return pool.submit(fn)
+
+
+# Telegram 单条消息上限（按 UTF-16 码元计）
+TG_MESSAGE_LIMIT = 4096
+
+
+def _truncate_for_telegram(text: str, parse_mode: str = None) -> str:
+    """超过 Telegram 长度上限时截断消息
+
+    上限按 UTF-16 码元计算（emoji 占 2 个）；截断点不会落在代理对或 MarkdownV2 转义符中间
+    """
+    # 每个字符最多 2 个 UTF-16 码元，短消息无需编码即可判定未超限
+    if len(text) * 2 <= TG_MESSAGE_LIMIT:
+        return text
+    encoded = text.encode('utf-16-le')
+    if len(encoded) // 2 <= TG_MESSAGE_LIMIT:
+        return text
+
+    logger.warning(f"⚠️ 通知消息过长 ({len(encoded) // 2} 字符)，将被截断")
+    suffix = "...\n\n[消息已截断]"
+    if parse_mode == 'MarkdownV2':
+        suffix = escape_markdown_v2(suffix)
+    keep_units = TG_MESSAGE_LIMIT - len(suffix.encode('utf-16-le')) // 2
+    head = encoded[:keep_units * 2].decode('utf-16-le', errors='ignore')
+    # 去掉末尾落单的转义反斜杠
+    trailing = len(head) - len(head.rstrip('\\'))
+    if trailing % 2:
+        head = head[:-1]
+    return head + suffix
+
+
+# 降级为纯文本时移除 Markdown 符号的转换表
+_PLAIN_TEXT_TABLE = str.maketrans({'*': '', '_': '', '`': '', '┃': '|'})
+
+
 def _send_crawl_report(summary: dict, force_send=False):
     """发送爬虫任务完成报告（优化版本）
 
@@ -639,9 +1003,7 @@ def _send_crawl_report(summary: dict, force_send=False):
         text, parse_mode = build_crawl_report_message(summary)
 
         # 检查消息长度
-        if len(text) > 4096:
-            logger.warning(f"⚠️ 通知消息过长 ({len(text)} 字节)，将被截断")
-            text = text[:4090] + "...\n\n[消息已截断]"
+        text = _truncate_for_telegram(text, parse_mode)
 
         # 先尝试 Markdown 格式
         success = _send_telegram_message(text, parse_mode=parse_mode)
@@ -650,12 +1012,8 @@ def _send_crawl_report(summary: dict, force_send=False):
         if not success:
             logger.warning("⚠️ Markdown 格式发送失败，降级到纯文本格式")
             # 移除所有 Markdown 格式符号，但保留 emoji
-            plain_text = text
-            plain_text = plain_text.replace('*', '')  # 移除粗体
-            plain_text = plain_text.replace('_', '')  # 移除斜体（这是导致问题的字符！）
-            plain_text = plain_text.replace('`', '')  # 移除代码
-            plain_text = plain_text.replace('━━', '==')  # 替换分隔线
-            plain_text = plain_text.replace('┃', '|')  # 替换竖线
+            # 粗体、斜体（这是导致问题的字符！）、代码符号一次移除，竖线替换，分隔线替换
+            plain_text = text.translate(_PLAIN_TEXT_TABLE).replace('━━', '==')
             success = _send_telegram_message(plain_text, parse_mode=None)
 
             if not success:
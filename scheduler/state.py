@@ -5,17 +5,86 @@
 集成统一状态管理器，保持向后兼容
 """
 
+import time
+import queue
+import itertools
+import contextvars
 import logging
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Optional, Dict
+from flask import current_app, has_app_context
 
 logger = logging.getLogger(__name__)
 
+# 统一状态管理器在导入时解析一次（它只依赖 cache_manager，不存在循环导入），
+# sync_crawl_state 据 HAVE_UNIFIED 选择发布后端，而不是每次靠异常回退
+try:
+    from utils.state_manager import (
+        update_unified_state, get_unified_state, sync_from_legacy, get_unified_version
+    )
+    _unified_api = (update_unified_state, get_unified_state, sync_from_legacy, get_unified_version)
+    HAVE_UNIFIED = True
+except ImportError:
+    _unified_api = None
+    HAVE_UNIFIED = False
+
+# 延迟解析的依赖：首次使用时导入并缓存到模块全局，避免热路径上反复执行 import 语句
+# （同时保留延迟导入以规避循环依赖）
+_cache_api = None
+_bridge_getter = None
+
+
+def _get_unified_api():
+    """返回 (update_unified_state, get_unified_state, sync_from_legacy, get_unified_version)"""
+    if _unified_api is None:
+        raise ImportError("统一状态管理器不可用")
+    return _unified_api
+
+
+def _get_cache_api():
+    """返回 (cache_manager, CacheKeys)"""
+    global _cache_api
+    api = _cache_api
+    if api is None:
+        from cache_manager import cache_manager, CacheKeys
+        api = _cache_api = (cache_manager, CacheKeys)
+    return api
+
+
+def _get_bridge():
+    """返回爬虫控制桥接器实例"""
+    global _bridge_getter
+    getter = _bridge_getter
+    if getter is None:
+        from crawler_control.cc_control_bridge import get_crawler_control_bridge
+        getter = _bridge_getter = get_crawler_control_bridge
+    return getter()
+
+
+# sync_to_cache 回退写入 CRAWL_STATE 的有效期（秒），及上次写入的 (时间, 内容)
+_LEGACY_STATE_TTL = 3600
+_last_legacy_write = None
+
+
+# CrawlState 中的进度字段（to_dict 的 progress 部分）
+_PROGRESS_FIELDS = (
+    'sections_total', 'sections_done', 'current_section', 'current_page',
+    'max_pages', 'total_saved', 'total_skipped',
+    # 页码概念区分字段
+    'current_page_actual', 'max_pages_actual', 'current_page_task', 'max_pages_task',
+)
+# 与统一状态管理器双向同步的字段
+_SYNC_FIELDS = ('is_crawling', 'is_paused', 'should_stop', 'message') + _PROGRESS_FIELDS
+
 
-@dataclass
+@dataclass(slots=True)
 class CrawlState:
-    """爬虫状态管理 - 单一数据源（保持向后兼容）"""
+    """爬虫状态管理 - 单一数据源（保持向后兼容）
+
+    使用 __slots__：省去实例 __dict__，字段读写走固定槽位
+    """
     is_crawling: bool = False
     is_paused: bool = False
     should_stop: bool = False
@@ -42,239 +111,337 @@ class CrawlState:
             'is_crawling': self.is_crawling,
             'is_paused': self.is_paused,
             'message': self.message,
-            'progress': {
-                'sections_total': self.sections_total,
-                'sections_done': self.sections_done,
-                'current_section': self.current_section,
-                'current_page': self.current_page,
-                'max_pages': self.max_pages,
-                'total_saved': self.total_saved,
-                'total_skipped': self.total_skipped,
-                # 页码概念区分字段
-                'current_page_actual': self.current_page_actual,
-                'max_pages_actual': self.max_pages_actual,
-                'current_page_task': self.current_page_task,
-                'max_pages_task': self.max_pages_task,
-            }
+            'progress': {k: getattr(self, k) for k in _PROGRESS_FIELDS},
         }
     
     def sync_to_cache(self):
         """同步到共享缓存（使用新的状态管理器）"""
         try:
-            from utils.state_manager import update_unified_state
+            update_unified_state = _get_unified_api()[0]
 
             # 转换为统一状态格式
-            updates = {
-                'is_crawling': self.is_crawling,
-                'is_paused': self.is_paused,
-                'should_stop': self.should_stop,
-                'message': self.message,
-                'sections_total': self.sections_total,
-                'sections_done': self.sections_done,
-                'current_section': self.current_section,
-                'current_page': self.current_page,
-                'max_pages': self.max_pages,
-                'total_saved': self.total_saved,
-                'total_skipped': self.total_skipped,
-                # 页码概念区分字段
-                'current_page_actual': self.current_page_actual,
-                'max_pages_actual': self.max_pages_actual,
-                'current_page_task': self.current_page_task,
-                'max_pages_task': self.max_pages_task,
-            }
+            updates = {k: getattr(self, k) for k in _SYNC_FIELDS}
 
             update_unified_state(updates, source='crawl_state')
 
         except Exception as e:
             logger.debug(f"同步到统一状态管理器失败: {e}")
-            # 回退到传统方式
-            from cache_manager import cache_manager, CacheKeys
-            cache_manager.shared_set(CacheKeys.CRAWL_STATE, self.to_dict())
+            # 回退到传统方式：状态未变且上次写入未过半个有效期时跳过序列化与写入
+            global _last_legacy_write
+            payload = self.to_dict()
+            now = time.monotonic()
+            last = _last_legacy_write
+            if last is not None and last[1] == payload and now - last[0] < _LEGACY_STATE_TTL / 2:
+                return
+            cache_manager, CacheKeys = _get_cache_api()
+            cache_manager.shared_set(CacheKeys.CRAWL_STATE, payload, ttl=_LEGACY_STATE_TTL)
+            _last_legacy_write = (now, payload)
     
     @classmethod
     def from_cache(cls) -> 'CrawlState':
         """从缓存恢复（优先使用统一状态管理器）"""
         try:
-            from utils.state_manager import get_unified_state
+            get_unified_state = _get_unified_api()[1]
 
             # 从统一状态管理器获取
             state_data = get_unified_state()
-            if state_data.get('has_changes', True):
-                return cls(
-                    is_crawling=state_data.get('is_crawling', False),
-                    is_paused=state_data.get('is_paused', False),
-                    should_stop=state_data.get('should_stop', False),
-                    message=state_data.get('message', '空闲'),
-                    sections_total=state_data.get('sections_total', 0),
-                    sections_done=state_data.get('sections_done', 0),
-                    current_section=state_data.get('current_section', ''),
-                    current_page=state_data.get('current_page', 0),
-                    max_pages=state_data.get('max_pages', 0),
-                    total_saved=state_data.get('total_saved', 0),
-                    total_skipped=state_data.get('total_skipped', 0),
-                    # 页码概念区分字段
-                    current_page_actual=state_data.get('current_page_actual', 0),
-                    max_pages_actual=state_data.get('max_pages_actual', 0),
-                    current_page_task=state_data.get('current_page_task', 0),
-                    max_pages_task=state_data.get('max_pages_task', 0),
-                )
+            # 冷启动时统一状态为空或只有版本信息（不含状态字段），不逐字段构造，直接走传统缓存
+            if state_data and 'is_crawling' in state_data:
+                return cls(**{k: state_data.get(k, d) for k, d in _SYNC_DEFAULTS.items()})
         except Exception as e:
             logger.debug(f"从统一状态管理器恢复失败: {e}")
 
         # 回退到传统方式
         try:
-            from cache_manager import cache_manager, CacheKeys
+            cache_manager, CacheKeys = _get_cache_api()
             data = cache_manager.shared_get(CacheKeys.CRAWL_STATE)
-            if data:
-                return cls(**data)
+            if not data:
+                return cls()
+            # sync_to_cache 回退写入的是 to_dict() 格式，进度字段嵌套在 progress 下；
+            # 展平后只展开已知字段，避免多余键导致 TypeError
+            progress = data.get('progress')
+            if isinstance(progress, dict):
+                data = {**data, **progress}
+            return cls(**{k: v for k, v in data.items() if k in _FIELD_NAMES})
         except Exception as e:
             logger.debug(f"从传统缓存恢复失败: {e}")
 
         return cls()
 
 
+# 同步字段的默认值（取自 CrawlState 字段定义，供 from_cache 补齐缺失项）
+_SYNC_DEFAULTS = {f.name: f.default for f in fields(CrawlState) if f.name in _SYNC_FIELDS}
+# CrawlState 全部字段名（from_cache 过滤传统缓存数据用）
+_FIELD_NAMES = frozenset(f.name for f in fields(CrawlState))
+
+
 # 全局单例
 _crawl_state = None
+_crawl_state_lock = threading.Lock()
 
 
 def get_crawl_state() -> CrawlState:
+    """获取全局爬虫状态（已初始化时无锁读取，仅首次初始化加锁）"""
     global _crawl_state
-    if _crawl_state is None:
-        _crawl_state = CrawlState.from_cache()
-    return _crawl_state
+    state = _crawl_state
+    if state is None:
+        with _crawl_state_lock:
+            if _crawl_state is None:
+                _crawl_state = CrawlState.from_cache()
+            state = _crawl_state
+    return state
+
+
+# CRAWL_PROGRESS 中同步到统一状态管理器的字段及缺省值
+_LEGACY_PROGRESS_DEFAULTS = {
+    'sections_total': 0,
+    'sections_done': 0,
+    'current_section': '',
+    'current_page': 0,
+    'current_section_pages': 0,
+    'current_section_processed': 0,
+    'max_pages': 0,
+    'processed_pages': 0,
+    'estimated_total_pages': 0,
+    'progress_percent': 0.0,
+    'total_saved': 0,
+    'total_skipped': 0,
+    'total_failed': 0,
+    'current_section_saved': 0,
+    'current_section_skipped': 0,
+    'start_time': None,
+    # 页码概念区分字段
+    'current_page_actual': 0,       # 实际论坛页码
+    'current_page_task': 0,         # 任务进度页码
+    'max_pages_actual': 0,          # 实际板块最大页
+    'max_pages_task': 0,            # 本次任务总页数
+}
+# 推送给状态协调器的进度字段（不含 start_time）
+_COORD_PROGRESS_DEFAULTS = {k: v for k, v in _LEGACY_PROGRESS_DEFAULTS.items() if k != 'start_time'}
+
+
+# 状态版本号：修改 CRAWL_STATUS/PROGRESS/CONTROL 后调用 mark_crawl_state_dirty() 递增
+# sync_crawl_state 据此跳过无变化的同步，并按最小间隔合并突发更新
+SYNC_MIN_INTERVAL = 0.1
+_state_version = 0
+_last_synced_version = -1
+_last_sync_time = 0.0
+
+# 上次推送到统一状态管理器的字段快照，及推送后的统一状态版本号
+_MISSING = object()
+_last_sync_snapshot: Dict = {}
+_last_sync_unified_version = -1
+# 上次推送给状态协调器的 (协调器状态对象, 进度值)；reset_state 会替换状态对象
+_last_coord_progress = None
+
+
+# 协调器进度更新队列：容量为 1，只保留最新一份进度，由后台线程写入，
+# 避免协调器的增量日志写入阻塞调度线程
+_coord_queue = queue.Queue(maxsize=1)
+_coord_worker = None
+_coord_worker_lock = threading.Lock()
+# 每份进度提交时分配递增序号；写入协调器统一持有 _coord_apply_lock，
+# 序号不大于已写入序号的旧进度直接丢弃，避免后台线程把旧进度写在强制同步之后
+_coord_seq = itertools.count(1)
+_coord_apply_lock = threading.Lock()
+_coord_applied_seq = 0
+
+
+def _apply_coord_progress(seq, coordinator, progress_data):
+    """在 _coord_apply_lock 下写入协调器进度，已被更新序号覆盖的旧进度跳过"""
+    global _coord_applied_seq
+    with _coord_apply_lock:
+        if seq <= _coord_applied_seq:
+            return
+        _coord_applied_seq = seq
+        coordinator.update_progress(progress_data)
+
+
+def _coord_worker_loop():
+    while True:
+        seq, coordinator, progress_data = _coord_queue.get()
+        try:
+            _apply_coord_progress(seq, coordinator, progress_data)
+        except Exception as e:
+            logger.debug(f"同步进度到状态协调器失败: {e}")
+
+
+def _submit_coord_progress(coordinator, progress_data):
+    """提交进度给后台线程写入协调器；队列中尚未写入的旧进度直接被替换"""
+    global _coord_worker
+    if _coord_worker is None:
+        with _coord_worker_lock:
+            if _coord_worker is None:
+                _coord_worker = threading.Thread(target=_coord_worker_loop, name='coord-progress', daemon=True)
+                _coord_worker.start()
+    item = (next(_coord_seq), coordinator, progress_data)
+    while True:
+        try:
+            _coord_queue.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                _coord_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def mark_crawl_state_dirty():
+    """标记爬虫状态已变更，下次 sync_crawl_state 将执行实际同步"""
+    global _state_version
+    _state_version += 1
+
+
+# 当前执行上下文绑定的 (CRAWL_STATUS, CRAWL_PROGRESS, CRAWL_CONTROL) 字典引用；
+# app.config 中的这三个字典只原地修改、不会被替换，绑定后热路径直接读取，
+# 不必每次经 current_app 代理查找 app.config
+crawl_state_sources_var = contextvars.ContextVar('crawl_state_sources', default=None)
+
+
+def bind_crawl_state_sources(status, progress, control) -> contextvars.Token:
+    """将三份状态字典绑定到当前上下文，返回可用于 reset 的 Token"""
+    return crawl_state_sources_var.set((status, progress, control))
+
+
+def bind_app_crawl_state_sources():
+    """Flask before_request 钩子：将 app.config 中的三份状态字典绑定到当前请求上下文"""
+    cfg = current_app.config
+    bind_crawl_state_sources(cfg.get('CRAWL_STATUS'), cfg.get('CRAWL_PROGRESS'), cfg.get('CRAWL_CONTROL'))
+
 
+def _read_crawl_state_sources():
+    """读取 (status, progress, control) 三份爬虫状态
 
-def sync_crawl_state():
-    """将当前内存中的爬虫状态和进度同步到共享存储 (核心同步逻辑)"""
+    优先使用当前上下文已绑定的字典；其次在 Flask 应用上下文中读 app.config，
+    否则一次批量读取共享缓存（多进程安全）；取不到的项为 None
+    """
+    sources = crawl_state_sources_var.get()
+    if sources is not None:
+        return sources
+    if has_app_context():
+        cfg = current_app.config
+        return cfg.get('CRAWL_STATUS'), cfg.get('CRAWL_PROGRESS'), cfg.get('CRAWL_CONTROL')
     try:
-        # 优先使用统一状态管理器
-        from utils.state_manager import update_unified_state, sync_from_legacy
+        cache_manager, CacheKeys = _get_cache_api()
+        status, progress, control = (v or None for v in cache_manager.shared_mget(
+            (CacheKeys.CRAWL_STATUS, CacheKeys.CRAWL_PROGRESS, CacheKeys.CRAWL_CONTROL)))
+        return status, progress, control
+    except Exception:
+        return None, None, None
 
-        # 先从传统源同步到统一状态管理器
-        sync_from_legacy()
 
-        # 从 Flask app.config 或全局变量获取状态
-        updates = {}
+def _publish_unified(status, progress, control):
+    """将三份状态发布到统一状态管理器（只推送变化字段）"""
+    global _last_sync_unified_version
 
-        try:
-            from flask import current_app
+    update_unified_state, _, sync_from_legacy, get_unified_version = _unified_api
 
-            status = current_app.config.get('CRAWL_STATUS')
-            progress = current_app.config.get('CRAWL_PROGRESS')
-            control = current_app.config.get('CRAWL_CONTROL')
+    # 三个来源都取不到时才从传统源同步到统一状态管理器；
+    # 取到时下面的更新已覆盖 sync_from_legacy 会写入的全部字段，无需再走一遍
+    if not (status or progress or control):
+        sync_from_legacy()
 
-        except:
-            # 回退到共享缓存（多进程安全）
-            try:
-                from cache_manager import cache_manager, CacheKeys
-                status = cache_manager.shared_get(CacheKeys.CRAWL_STATUS) or None
-                progress = cache_manager.shared_get(CacheKeys.CRAWL_PROGRESS) or None
-                control = cache_manager.shared_get(CacheKeys.CRAWL_CONTROL) or None
-            except:
-                status = progress = control = None
-
-        # 构建更新数据
-        if status:
-            updates.update({
-                'is_crawling': status.get('is_crawling', False),
-                'is_paused': status.get('is_paused', False),
-                'message': status.get('message', '空闲')
-            })
+    # 构建更新数据
+    updates = {}
+    if status:
+        sget = status.get
+        updates['is_crawling'] = sget('is_crawling', False)
+        updates['is_paused'] = sget('is_paused', False)
+        updates['message'] = sget('message', '空闲')
+
+    if progress:
+        pget = progress.get
+        updates.update({k: pget(k, d) for k, d in _LEGACY_PROGRESS_DEFAULTS.items()})
+
+    if control:
+        cget = control.get
+        updates['should_stop'] = cget('stop', False)
+        updates['is_paused'] = cget('paused', False)
+
+    # 只推送与上次已发送快照不同的字段；若期间统一状态被其他来源改写过
+    # （版本号不再是上次推送后的值），快照失效，改为全量推送
+    if updates:
+        if get_unified_version() != _last_sync_unified_version:
+            _last_sync_snapshot.clear()
+        snapshot_get = _last_sync_snapshot.get
+        delta = {k: v for k, v in updates.items() if snapshot_get(k, _MISSING) != v}
+        if delta:
+            update_unified_state(delta, source='sync_crawl_state')
+            _last_sync_snapshot.update(delta)
+        _last_sync_unified_version = get_unified_version()
+
+
+def _publish_coordinator(progress, force):
+    """同步进度到状态协调器"""
+    global _last_coord_progress
+
+    if not progress:
+        return
+    try:
+        # 进度值与上次推送相同且协调器状态未被重置时跳过（协调器更新会触发日志落盘）
+        coordinator = _get_bridge().coordinator
+        coord_state = coordinator.get_current_state()
+        pget = progress.get
+        values = tuple(pget(k, d) for k, d in _COORD_PROGRESS_DEFAULTS.items())
+        if _last_coord_progress is None or _last_coord_progress[0] is not coord_state \
+                or _last_coord_progress[1] != values:
+            progress_data = dict(zip(_COORD_PROGRESS_DEFAULTS, values))
+            if force:
+                # 关键节点（板块/任务结束）同步写入，保证落盘；
+                # 丢弃队列中尚未写入的旧进度，后台线程已取出的旧进度会因序号较小被跳过
+                seq = next(_coord_seq)
+                try:
+                    pending = _coord_queue.get_nowait()
+                except queue.Empty:
+                    pending = None
+                _apply_coord_progress(seq, coordinator, progress_data)
+                if pending is not None and pending[0] > seq:
+                    _apply_coord_progress(*pending)
+            else:
+                _submit_coord_progress(coordinator, progress_data)
+            _last_coord_progress = (coord_state, values)
+    except Exception as e:
+        logger.debug(f"同步进度到状态协调器失败: {e}")
 
-        if progress:
-            updates.update({
-                'sections_total': progress.get('sections_total', 0),
-                'sections_done': progress.get('sections_done', 0),
-                'current_section': progress.get('current_section', ''),
-                'current_page': progress.get('current_page', 0),
-                'current_section_pages': progress.get('current_section_pages', 0),
-                'current_section_processed': progress.get('current_section_processed', 0),
-                'max_pages': progress.get('max_pages', 0),
-                'processed_pages': progress.get('processed_pages', 0),
-                'estimated_total_pages': progress.get('estimated_total_pages', 0),
-                'progress_percent': progress.get('progress_percent', 0.0),
-                'total_saved': progress.get('total_saved', 0),
-                'total_skipped': progress.get('total_skipped', 0),
-                'total_failed': progress.get('total_failed', 0),
-                'current_section_saved': progress.get('current_section_saved', 0),
-                'current_section_skipped': progress.get('current_section_skipped', 0),
-                'start_time': progress.get('start_time'),
-                # 页码概念区分字段
-                'current_page_actual': progress.get('current_page_actual', 0),       # 实际论坛页码
-                'current_page_task': progress.get('current_page_task', 0),           # 任务进度页码
-                'max_pages_actual': progress.get('max_pages_actual', 0),             # 实际板块最大页
-                'max_pages_task': progress.get('max_pages_task', 0),                 # 本次任务总页数
-            })
 
+def _publish_legacy(status, progress, control):
+    """传统同步方式（向后兼容）：直接写回共享缓存"""
+    try:
+        cache_manager, CacheKeys = _get_cache_api()
+        if status:
+            cache_manager.shared_set(CacheKeys.CRAWL_STATUS, status)
+        if progress:
+            cache_manager.shared_set(CacheKeys.CRAWL_PROGRESS, progress)
         if control:
-            updates.update({
-                'should_stop': control.get('stop', False),
-                'is_paused': control.get('paused', False)
-            })
+            cache_manager.shared_set(CacheKeys.CRAWL_CONTROL, control)
+    except Exception as e:
+        logger.debug(f"传统状态同步失败: {e}")
 
-        # 更新统一状态
-        if updates:
-            update_unified_state(updates, source='sync_crawl_state')
 
-        # 同步进度到状态协调器 - 关键修复！
-        try:
-            from crawler_control.cc_control_bridge import get_crawler_control_bridge
-            bridge = get_crawler_control_bridge()
-
-            if progress:
-                # 构建progress字典
-                progress_data = {
-                    'sections_total': progress.get('sections_total', 0),
-                    'sections_done': progress.get('sections_done', 0),
-                    'current_section': progress.get('current_section', ''),
-                    'current_page': progress.get('current_page', 0),
-                    'current_section_pages': progress.get('current_section_pages', 0),
-                    'current_section_processed': progress.get('current_section_processed', 0),
-                    'max_pages': progress.get('max_pages', 0),
-                    'processed_pages': progress.get('processed_pages', 0),
-                    'estimated_total_pages': progress.get('estimated_total_pages', 0),
-                    'progress_percent': progress.get('progress_percent', 0.0),
-                    'total_saved': progress.get('total_saved', 0),
-                    'total_skipped': progress.get('total_skipped', 0),
-                    'total_failed': progress.get('total_failed', 0),
-                    'current_section_saved': progress.get('current_section_saved', 0),
-                    'current_section_skipped': progress.get('current_section_skipped', 0),
-                    # 页码概念区分字段
-                    'current_page_actual': progress.get('current_page_actual', 0),       # 实际论坛页码
-                    'current_page_task': progress.get('current_page_task', 0),           # 任务进度页码
-                    'max_pages_actual': progress.get('max_pages_actual', 0),             # 实际板块最大页
-                    'max_pages_task': progress.get('max_pages_task', 0),                 # 本次任务总页数
-                }
-                bridge.coordinator.update_progress(progress_data)
-        except Exception as e:
-            logger.debug(f"同步进度到状态协调器失败: {e}")
+def sync_crawl_state(force: bool = False):
+    """将当前内存中的爬虫状态和进度同步到共享存储 (核心同步逻辑)
 
-    except Exception as e:
-        logger.debug(f"统一状态同步失败，回退到传统方式: {e}")
+    Args:
+        force: 为 True 时忽略版本与节流检查，强制同步（用于板块/任务结束等关键节点）
+    """
+    global _last_synced_version, _last_sync_time
 
-        # 传统同步方式（向后兼容）
-        try:
-            from flask import current_app
-            from cache_manager import cache_manager
+    version = _state_version
+    now = time.monotonic()
+    if not force and (version == _last_synced_version or now - _last_sync_time < SYNC_MIN_INTERVAL):
+        return
+    _last_synced_version = version
+    _last_sync_time = now
 
-            # 优先从 Flask app.config 获取 (如果有上下文)
-            try:
-                status = current_app.config.get('CRAWL_STATUS')
-                progress = current_app.config.get('CRAWL_PROGRESS')
-                control = current_app.config.get('CRAWL_CONTROL')
-            except:
-                # 回退到共享缓存（多进程安全）
-                from cache_manager import cache_manager, CacheKeys
-                status = cache_manager.shared_get(CacheKeys.CRAWL_STATUS)
-                progress = cache_manager.shared_get(CacheKeys.CRAWL_PROGRESS)
-                control = cache_manager.shared_get(CacheKeys.CRAWL_CONTROL)
-
-            if status:
-                cache_manager.shared_set(CacheKeys.CRAWL_STATUS, status)
-            if progress:
-                cache_manager.shared_set(CacheKeys.CRAWL_PROGRESS, progress)
-            if control:
-                cache_manager.shared_set(CacheKeys.CRAWL_CONTROL, control)
-
-        except Exception as e2:
-            logger.debug(f"传统状态同步也失败: {e2}")
\ No newline at end of file
+    status, progress, control = _read_crawl_state_sources()
+
+    if HAVE_UNIFIED:
+        try:
+            _publish_unified(status, progress, control)
+        except Exception as e:
+            logger.debug(f"统一状态同步失败，回退到传统方式: {e}")
+            _publish_legacy(status, progress, control)
+            return
+        _publish_coordinator(progress, force)
+    else:
+        _publish_legacy(status, progress, control)
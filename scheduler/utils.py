@@ -7,6 +7,7 @@
 import time
 import logging
 import threading
+from flask import current_app, has_app_context
 from configuration import config_manager
 
 logger = logging.getLogger(__name__)
@@ -16,13 +17,49 @@ pause_event = threading.Event()
 pause_event.set()  # 默认为已设置（即非暂停状态），clear()表示暂停
 stop_event = threading.Event()
 
+# 本进程内发出过尚未经完整检查的控制信号
+_signal_pending = threading.Event()
+# fast_check_stop 两次完整检查的最大间隔（秒），覆盖其他进程写入信号队列的情况
+FAST_CHECK_INTERVAL = 0.5
+_last_full_check = 0.0
+
+# 延迟解析的依赖：首次使用时导入并缓存，避免轮询热路径上反复执行 import 语句
+_bridge_getter = None
+_state_api = None
+
+
+def _get_bridge():
+    """返回爬虫控制桥接器实例"""
+    global _bridge_getter
+    getter = _bridge_getter
+    if getter is None:
+        from crawler_control.cc_control_bridge import get_crawler_control_bridge
+        # 订阅桥接器的信号：任何入口发出停止都会立即置位 stop_event，
+        # sleep_interruptible 只需等待本地事件，无需轮询桥接器；
+        # 任意信号都会置位 _signal_pending，供 fast_check_stop 走完整检查
+        bridge = get_crawler_control_bridge()
+        bridge.on_stop(stop_event.set)
+        for signal_type in ('stop', 'pause', 'resume'):
+            bridge.on_signal(signal_type, _signal_pending.set)
+        getter = _bridge_getter = get_crawler_control_bridge
+    return getter()
+
+
+def _get_state_api():
+    """返回 (sync_crawl_state, mark_crawl_state_dirty, crawl_state_sources_var)（延迟导入避免循环依赖）"""
+    global _state_api
+    api = _state_api
+    if api is None:
+        from .state import sync_crawl_state, mark_crawl_state_dirty, crawl_state_sources_var
+        api = _state_api = (sync_crawl_state, mark_crawl_state_dirty, crawl_state_sources_var)
+    return api
+
 
 def pause_crawling_task():
     """暂停爬虫任务"""
     # 使用新的控制桥接器
     try:
-        from crawler_control.cc_control_bridge import get_crawler_control_bridge
-        bridge = get_crawler_control_bridge()
+        bridge = _get_bridge()
         signal_id = bridge.send_pause_signal()
         logger.info(f"✅ 已发送暂停信号: {signal_id}")
         return True, "爬虫已暂停"
@@ -42,8 +79,7 @@ def resume_crawling_task():
     """恢复爬虫任务"""
     # 使用新的控制桥接器
     try:
-        from crawler_control.cc_control_bridge import get_crawler_control_bridge
-        bridge = get_crawler_control_bridge()
+        bridge = _get_bridge()
         signal_id = bridge.send_resume_signal()
         logger.info(f"✅ 已发送恢复信号: {signal_id}")
         return True, "爬虫已恢复"
@@ -63,8 +99,7 @@ def stop_crawling_task(force=False):
     """停止爬虫任务"""
     # 使用新的控制桥接器
     try:
-        from crawler_control.cc_control_bridge import get_crawler_control_bridge
-        bridge = get_crawler_control_bridge()
+        bridge = _get_bridge()
         signal_id = bridge.send_stop_signal()
         logger.info(f"✅ 已发送停止信号: {signal_id}")
         return True, "正在停止爬虫任务..."
@@ -92,13 +127,11 @@ def check_stop_and_pause():
         - 如果恢复，返回 False 继续执行
         - 如果等待期间收到停止，返回 True
     """
-    # 延迟导入避免循环依赖
-    from .state import sync_crawl_state
+    sync_crawl_state = _get_state_api()[0]
 
     try:
         # 使用新的控制桥接器检查信号
-        from crawler_control.cc_control_bridge import get_crawler_control_bridge
-        bridge = get_crawler_control_bridge()
+        bridge = _get_bridge()
 
         # 只调用一次，完全信任 bridge 的处理结果
         should_stop = bridge.check_stop_and_pause()
@@ -113,78 +146,121 @@ def check_stop_and_pause():
         return _check_stop_and_pause_legacy()
 
 
+def fast_check_stop():
+    """
+    热路径上的停止/暂停检查（逐条处理的内层循环使用）
+
+    没有待处理信号且距上次完整检查不足 FAST_CHECK_INTERVAL 时直接返回 False，
+    不访问桥接器与信号队列；否则执行完整的 check_stop_and_pause()
+
+    返回:
+        bool: True=需要停止, False=继续执行
+    """
+    global _last_full_check
+    if stop_event.is_set():
+        return True
+    now = time.monotonic()
+    if not _signal_pending.is_set() and now - _last_full_check < FAST_CHECK_INTERVAL:
+        return False
+    # 先清除再检查：检查期间新到的信号会重新置位
+    _signal_pending.clear()
+    _last_full_check = now
+    return check_stop_and_pause()
+
+
+def _update_legacy_status(crawl_status, changes):
+    """将状态变更合并进 crawl_status，并以一次 shared_update 写入共享缓存"""
+    crawl_status.update(changes)
+    try:
+        from cache_manager import cache_manager, CacheKeys
+        cache_manager.shared_update(CacheKeys.CRAWL_STATUS, changes)
+    except Exception as e:
+        logger.debug(f"写入共享爬虫状态失败: {e}")
+    _get_state_api()[1]()
+
+
 def _check_stop_and_pause_legacy():
     """降级到旧系统的检查逻辑（独立函数，便于维护）"""
-    from .state import sync_crawl_state
+    sync_crawl_state = _get_state_api()[0]
 
-    try:
-        from flask import current_app
-        crawl_control = current_app.config.get('CRAWL_CONTROL', {})
-        crawl_status = current_app.config.get('CRAWL_STATUS', {})
-    except Exception:
+    sources = _get_state_api()[2].get()
+    if sources is not None:
+        crawl_status, _, crawl_control = (v if v is not None else {} for v in sources)
+        reload_control = None
+    elif has_app_context():
+        cfg = current_app.config
+        crawl_control = cfg.get('CRAWL_CONTROL', {})
+        crawl_status = cfg.get('CRAWL_STATUS', {})
+        reload_control = None
+    else:
         try:
             from cache_manager import cache_manager, CacheKeys
-            crawl_control = cache_manager.shared_get(CacheKeys.CRAWL_CONTROL) or {}
-            crawl_status = cache_manager.shared_get(CacheKeys.CRAWL_STATUS) or {}
+            crawl_control, crawl_status = (v or {} for v in cache_manager.shared_mget(
+                (CacheKeys.CRAWL_CONTROL, CacheKeys.CRAWL_STATUS)))
         except Exception:
             return False
 
+        def reload_control():
+            return cache_manager.shared_get(CacheKeys.CRAWL_CONTROL) or {}
+
     # 检查停止信号
     if crawl_control.get('stop'):
         logger.info("⏹️ 收到停止信号（旧系统）")
-        crawl_status['message'] = '任务已停止'
-        crawl_status['is_crawling'] = False
-        sync_crawl_state()
+        _update_legacy_status(crawl_status, {'message': '任务已停止', 'is_crawling': False})
+        sync_crawl_state(force=True)
         return True
 
     # 检查暂停状态
     while crawl_control.get('paused'):
         if crawl_control.get('stop'):
             return True
-        crawl_status['message'] = '任务已暂停'
-        crawl_status['is_paused'] = True
+        if not crawl_status.get('is_paused') or crawl_status.get('message') != '任务已暂停':
+            _update_legacy_status(crawl_status, {'message': '任务已暂停', 'is_paused': True})
         sync_crawl_state()
         time.sleep(0.5)
+        if reload_control is not None:
+            # 共享缓存读到的是快照，需重新读取才能看到恢复/停止
+            crawl_control = reload_control()
 
     # 从暂停恢复
     if crawl_status.get('is_paused'):
-        crawl_status['is_paused'] = False
-        crawl_status['message'] = '正在爬取'
-        sync_crawl_state()
+        _update_legacy_status(crawl_status, {'is_paused': False, 'message': '正在爬取'})
+        sync_crawl_state(force=True)
         logger.info("▶️ 任务已恢复（旧系统）")
 
     return False
 
 
-def sleep_interruptible(seconds):
-    """可中断的休眠逻辑"""
+def _stop_requested():
+    """查询一次当前是否已有停止请求（桥接器状态机优先，失败降级到旧系统）"""
     try:
-        # 使用新的控制桥接器
-        from crawler_control.cc_control_bridge import get_crawler_control_bridge
-        bridge = get_crawler_control_bridge()
-        
-        start_time = time.time()
-        while time.time() - start_time < seconds:
-            if bridge.should_stop():
-                return True
-            time.sleep(0.2)
-        return False
+        return _get_bridge().should_stop()
     except Exception:
         # 降级到旧系统
-        try:
-            from flask import current_app
+        if has_app_context():
             crawl_control = current_app.config.get('CRAWL_CONTROL', {})
-        except Exception:
+        else:
             try:
                 from cache_manager import cache_manager, CacheKeys
                 crawl_control = cache_manager.shared_get(CacheKeys.CRAWL_CONTROL) or {}
             except Exception:
-                time.sleep(seconds)
                 return False
+        return bool(crawl_control.get('stop'))
+
+
+def sleep_interruptible(seconds):
+    """
+    可中断的休眠逻辑
+
+    阻塞在 stop_event 上等待（桥接器发出停止信号时经 on_stop 回调置位），
+    停止请求到达后立即唤醒，休眠期间不再轮询；
+    进入和结束休眠时各补查一次状态机，兼容未经停止信号下发的停止。
 
-        start_time = time.time()
-        while time.time() - start_time < seconds:
-            if crawl_control.get('stop'):
-                return True
-            time.sleep(0.2)
-        return False
\ No newline at end of file
+    返回:
+        bool: True=需要停止, False=休眠正常结束
+    """
+    if stop_event.is_set() or _stop_requested():
+        return True
+    if stop_event.wait(seconds):
+        return True
+    return _stop_requested()
@@ -7,17 +7,134 @@
 - 统计查询服务
 """
 
+import os
+import re
 import logging
 from datetime import timezone
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from sqlalchemy import func, or_, and_
+from sqlalchemy import func, or_, and_, text
+from sqlalchemy.orm import raiseload
 
-from models import db, Resource, Category
+from models import db, Resource, Category, RESOURCE_MISSING_CONDITIONS
+from configuration import config_manager
+from cache_manager import cache_manager, CacheKeys
 from utils.validators import PaginationValidator, DateValidator, StringValidator, RequestParams
 
 logger = logging.getLogger(__name__)
 
+# 可交给 to_tsquery 做词前缀预过滤的搜索词（纯字母数字；含 CJK 等字符的词只走 ILIKE）
+_TSQUERY_TERM_RE = re.compile(r'^[A-Za-z0-9]+$')
+_search_tsv_available: Optional[bool] = None
+
+
+def _has_search_tsv() -> bool:
+    """search_tsv 全文检索列是否可用（仅 PostgreSQL 且自愈迁移已建列，首次检查后缓存）"""
+    global _search_tsv_available
+    if _search_tsv_available is None:
+        try:
+            from sqlalchemy import inspect
+            engine = db.engine
+            _search_tsv_available = engine.dialect.name == 'postgresql' and any(
+                col['name'] == 'search_tsv' for col in inspect(engine).get_columns('resource'))
+        except Exception as e:
+            logger.debug(f"检查 search_tsv 列失败: {e}")
+            _search_tsv_available = False
+    return _search_tsv_available
+
+
+# 分类列表与资源统计的缓存有效期（秒）；资源增删、分类计数更新时主动失效
+_QUERY_CACHE_TTL = 120
+
+
+# 调试模式（与 app.py 相同的 FLASK_DEBUG 判定）下列表查询禁止任何关系懒加载：
+# to_dict 只读标量列，若日后新增关系并在序列化时访问，会立即报错暴露 N+1，
+# 届时应为该关系显式加上 selectinload
+_RAISE_ON_LAZY_LOAD = os.environ.get('FLASK_DEBUG') == '1'
+
+
+# 资源总数估算阈值：PostgreSQL 统计信息估算值低于该值时仍执行精确 COUNT(*)
+_ESTIMATE_COUNT_MIN = 100000
+
+
+def _count_resources_total() -> int:
+    """
+    资源总数
+
+    PostgreSQL 上大表直接读取 pg_class.reltuples 统计估算值（O(1)），
+    避免 COUNT(*) 全索引扫描；表较小、从未 ANALYZE（估算值为 -1）或其他数据库时精确计数
+    """
+    if db.engine.dialect.name == 'postgresql':
+        try:
+            estimate = db.session.execute(text(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = 'resource'"
+            )).scalar()
+            if estimate is not None and estimate >= _ESTIMATE_COUNT_MIN:
+                return int(estimate)
+        except Exception as e:
+            logger.debug(f"读取资源总数估算值失败: {e}")
+    return Resource.query.count()
+
+
+# publish_date 以 YYYY-MM-DD 文本存储，字典序即时间序；单边日期筛选用这两个值补齐区间
+_MIN_ISO_DATE = '0000-01-01'
+_MAX_ISO_DATE = '9999-12-31'
+
+
+def _normalize_date_bound(value) -> Optional[str]:
+    """将日期筛选参数统一为 YYYY-MM-DD 文本（支持 date/datetime 及 DateValidator 的格式），无法解析时原样返回"""
+    if not value:
+        return None
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d')
+    value = str(value).strip()
+    for fmt in DateValidator.SUPPORTED_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return value
+
+
+def _resource_list_query():
+    """资源列表查询的基础 Query"""
+    query = Resource.query
+    if _RAISE_ON_LAZY_LOAD:
+        query = query.options(raiseload('*'))
+    return query
+
+
+def _paginate_resources(query, order_clause, page: int, per_page: int) -> Dict[str, Any]:
+    """
+    分页查询资源并返回统一的分页结果字典
+
+    支持窗口函数时总数通过 COUNT(*) OVER () 随当页数据一次返回，不再单独执行 count()；
+    页码越界（当页无数据）时才补一次 count() 以得到准确总数。
+    不支持窗口函数的数据库（MySQL 5.7、旧版 SQLite 等）回退到 count() + limit/offset
+    """
+    offset = max(page - 1, 0) * per_page
+    if getattr(db.engine.dialect, 'supports_window_functions', False):
+        rows = query.add_columns(func.count().over().label('_total')) \
+            .order_by(order_clause).limit(per_page).offset(offset).all()
+        resources = [row[0] for row in rows]
+        if rows:
+            total = rows[0]._total
+        else:
+            total = query.count() if offset else 0
+    else:
+        total = query.count()
+        resources = query.order_by(order_clause).limit(per_page).offset(offset).all() if total else []
+
+    return {
+        'resources': [r.to_dict() for r in resources],
+        'total': total,
+        'pages': (total + per_page - 1) // per_page if total > 0 else 1,
+        'current_page': page,
+        'per_page': per_page,
+        'has_next': offset + per_page < total,
+        'has_prev': page > 1
+    }
+
 
 # ==================== 资源服务 ====================
 
@@ -42,7 +159,7 @@ class ResourceService:
             包含资源和分页信息的字典
         """
         from sqlalchemy import or_
-        query = Resource.query
+        query = _resource_list_query()
 
         if keyword:
             pattern = f"%{keyword}%"
@@ -53,22 +170,8 @@ class ResourceService:
             ))
 
         # 获取总数
-        total = query.count()
-
-        # 排序和分页
-        resources = query.order_by(Resource.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-
-        return {
-            'resources': [r.to_dict() for r in resources.items],
-            'total': total,
-            'pages': (total + per_page - 1) // per_page if total > 0 else 1,
-            'current_page': page,
-            'per_page': per_page,
-            'has_next': resources.has_next,
-            'has_prev': resources.has_prev
-        }
+        # 排序和分页（总数随分页结果一并返回）
+        return _paginate_resources(query, Resource.created_at.desc(), page, per_page)
 
     @staticmethod
     def cleanup_duplicates() -> int:
@@ -80,19 +183,17 @@ class ResourceService:
         """
         try:
             from sqlalchemy import text
-            results = db.session.execute(text(
-                "SELECT tid FROM resource GROUP BY tid HAVING COUNT(tid) > 1"
-            )).fetchall()
-
-            total_removed = 0
-            for row in results:
-                tid = row[0]
-                duplicates = Resource.query.filter_by(tid=tid).order_by(Resource.id.desc()).all()
-                for dup in duplicates[1:]:
-                    db.session.delete(dup)
-                    total_removed += 1
+            # 每个 tid 只保留 id 最大的一条，单条 DELETE 完成，不加载 ORM 对象；
+            # 子查询包一层派生表，兼容 MySQL 不允许在 DELETE 子查询中直接引用目标表的限制
+            result = db.session.execute(text(
+                "DELETE FROM resource WHERE id NOT IN ("
+                "SELECT keep_id FROM (SELECT MAX(id) AS keep_id FROM resource GROUP BY tid) AS keep)"
+            ))
+            total_removed = result.rowcount or 0
 
             db.session.commit()
+            if total_removed:
+                cache_manager.invalidate_data()
             logger.info(f"清理了 {total_removed} 条重复记录")
             return total_removed
         except Exception as e:
@@ -108,7 +209,6 @@ class ResourceService:
         Returns:
             统计数据字典
         """
-        from cache_manager import cache_manager, CacheKeys
         from datetime import datetime, timedelta
 
         # 尝试从缓存获取
@@ -117,9 +217,9 @@ class ResourceService:
             return cached_stats
 
         try:
-            total_count = Resource.query.count()
+            total_count = _count_resources_total()
 
-            # 统计今日新增 (UTC时间)
+            # 统计今日新增 (UTC时间)；created_at 已建索引，过滤计数走索引范围扫描
             today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
             today_count = Resource.query.filter(Resource.created_at >= today_start).count()
 
@@ -161,16 +261,16 @@ class ResourceService:
         """
         获取资源列表（支持多种筛选条件，含残缺数据筛选）
         """
-        query = Resource.query
+        query = _resource_list_query()
 
         # 结构化故障诊断筛选 - 支持多选叠加 (AND 逻辑)
         if incomplete_type:
             types = incomplete_type.split(',') if isinstance(incomplete_type, str) else incomplete_type
             
-            # 基础故障原子定义
-            is_unknown_sub = (Resource.sub_type == '未知') | (Resource.sub_type == '') | (Resource.sub_type.is_(None))
-            is_unknown_date = (Resource.publish_date == '未知') | (Resource.publish_date == '') | (Resource.publish_date.is_(None))
-            is_unknown_size = (Resource.size == 0) | (Resource.size.is_(None))
+            # 基础故障原子定义（与部分索引条件一致的字面 SQL，便于命中索引）
+            is_unknown_sub = text(RESOURCE_MISSING_CONDITIONS['sub_type'])
+            is_unknown_date = text(RESOURCE_MISSING_CONDITIONS['date'])
+            is_unknown_size = text(RESOURCE_MISSING_CONDITIONS['size'])
 
             # 只有当用户勾选了具体的瑕疵项时才进行 AND 叠加
             conditions = []
@@ -180,7 +280,7 @@ class ResourceService:
             
             # 特殊全量快捷项 (OR 逻辑)
             if 'any_missing' in types:
-                query = query.filter(is_unknown_sub | is_unknown_date | is_unknown_size)
+                query = query.filter(or_(is_unknown_sub, is_unknown_date, is_unknown_size))
             elif conditions:
                 # 叠加所有选中的瑕疵条件 (AND 逻辑)
                 for cond in conditions:
@@ -188,9 +288,9 @@ class ResourceService:
             
             # 兼容旧版的快捷综合项
             if 'total_loss' in types:
-                query = query.filter(is_unknown_sub & is_unknown_date & is_unknown_size)
+                query = query.filter(is_unknown_sub, is_unknown_date, is_unknown_size)
             elif 'critical_error' in types:
-                query = query.filter(is_unknown_sub & is_unknown_size)
+                query = query.filter(is_unknown_sub, is_unknown_size)
 
         # 分类筛选
         if category and category != 'all':
@@ -206,51 +306,52 @@ class ResourceService:
             if len(search_terms) == 1:
                 term = search_terms[0]
                 term_pattern = f'%{term}%'
-                query = query.filter(
-                    or_(
-                        Resource.title.ilike(term_pattern),
-                        Resource.sub_type.ilike(term_pattern)
-                    )
-                )
-            elif len(search_terms) > 1:
-                conditions = []
-                for term in search_terms:
-                    if len(term) >= 2:
-                        term_pattern = f'%{term}%'
-                        term_condition = or_(
+                if len(term) <= 2 and config_manager.get('SEARCH_SHORT_TERM_TITLE_ONLY', False):
+                    # 1-2 字短词（多为中文）几乎命中所有标题，类型标签稀疏，只查标题省去一半匹配
+                    query = query.filter(Resource.title.ilike(term_pattern))
+                else:
+                    query = query.filter(
+                        or_(
                             Resource.title.ilike(term_pattern),
                             Resource.sub_type.ilike(term_pattern)
                         )
-                        conditions.append(term_condition)
+                    )
+            elif len(search_terms) > 1:
+                terms = [term for term in search_terms if len(term) >= 2]
+                if (terms and config_manager.get('SEARCH_MULTI_TERM_PREFIX_MATCH', False)
+                        and _has_search_tsv() and all(_TSQUERY_TERM_RE.match(t) for t in terms)):
+                    # 一次 GIN 索引探测预过滤全部搜索词，下方 ILIKE 条件仍保留作复核。
+                    # to_tsquery 只能匹配词首：simple 分词把 CJK 视为字母，'高清SSIS123' 是一个词，
+                    # 搜 'SSIS' 将不再命中，故默认关闭，由 pg_trgm 索引支撑子串 ILIKE
+                    tsquery = ' & '.join(f'{t}:*' for t in terms)
+                    query = query.filter(
+                        text("resource.search_tsv @@ to_tsquery('simple', :tsq)").bindparams(tsq=tsquery)
+                    )
+
+                conditions = []
+                for term in terms:
+                    term_pattern = f'%{term}%'
+                    term_condition = or_(
+                        Resource.title.ilike(term_pattern),
+                        Resource.sub_type.ilike(term_pattern)
+                    )
+                    conditions.append(term_condition)
 
                 if conditions:
                     query = query.filter(and_(*conditions))
 
-        # 日期筛选
-        if date_start:
-            query = query.filter(Resource.publish_date >= date_start)
-
-        if date_end:
-            query = query.filter(Resource.publish_date <= date_end)
+        # 日期筛选：始终给出上下界，在 publish_date 索引上做一次闭区间范围扫描，
+        # 同时排除 '未知' / '' 等非日期值（'未知' 按字符串比较会大于任何日期）
+        if date_start or date_end:
+            query = query.filter(Resource.publish_date.between(
+                _normalize_date_bound(date_start) or _MIN_ISO_DATE,
+                _normalize_date_bound(date_end) or _MAX_ISO_DATE
+            ))
 
         # 获取总数
-        total = query.count()
-
-        # 排序和分页
+        # 排序和分页（总数随分页结果一并返回）
         order_field = getattr(Resource, order_by, Resource.created_at)
-        resources = query.order_by(order_field.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-
-        return {
-            'resources': [r.to_dict() for r in resources.items],
-            'total': total,
-            'pages': (total + per_page - 1) // per_page if total > 0 else 1,
-            'current_page': page,
-            'per_page': per_page,
-            'has_next': resources.has_next,
-            'has_prev': resources.has_prev
-        }
+        return _paginate_resources(query, order_field.desc(), page, per_page)
 
     @staticmethod
     def get_latest_resources_by_category(
@@ -315,21 +416,49 @@ class CategoryService:
             是否更新成功
         """
         try:
-            for fid, info in forums_info.items():
-                cat = Category.query.filter_by(fid=int(fid)).first()
-                if not cat:
-                    cat = Category(fid=int(fid), name=info.get('name', f"板块{fid}"))
-                    db.session.add(cat)
+            # 一次查询取回已有板块，新增与更新分别批量提交
+            fids = [int(fid) for fid in forums_info]
+            existing = {
+                row.fid: row for row in db.session.query(
+                    Category.id, Category.fid, Category.description,
+                    Category.total_topics, Category.total_pages
+                ).filter(Category.fid.in_(fids))
+            }
 
-                cat.description = info.get('description', cat.description or '')
+            now = datetime.now(timezone.utc)
+            inserts = []
+            updates = []
+            for fid, info in forums_info.items():
+                fid = int(fid)
+                cat = existing.get(fid)
                 topics_raw = info.get('total_topics') if info.get('total_topics') is not None else info.get('topics')
                 pages_raw = info.get('total_pages') if info.get('total_pages') is not None else info.get('pages')
 
-                cat.total_topics = topics_raw if topics_raw is not None else cat.total_topics
-                cat.total_pages = pages_raw if pages_raw is not None else cat.total_pages
-                cat.last_updated = datetime.now(timezone.utc)
+                if cat is None:
+                    inserts.append({
+                        'fid': fid,
+                        'name': info.get('name', f"板块{fid}"),
+                        'description': info.get('description', ''),
+                        'total_topics': topics_raw,
+                        'total_pages': pages_raw,
+                        'last_updated': now,
+                    })
+                else:
+                    updates.append({
+                        'id': cat.id,
+                        'description': info.get('description', cat.description or ''),
+                        'total_topics': topics_raw if topics_raw is not None else cat.total_topics,
+                        'total_pages': pages_raw if pages_raw is not None else cat.total_pages,
+                        'last_updated': now,
+                    })
+
+            if updates:
+                db.session.bulk_update_mappings(Category, updates)
+            if inserts:
+                db.session.bulk_insert_mappings(Category, inserts)
 
             db.session.commit()
+            cache_manager.invalidate_data()
             logger.info(f"成功更新 {len(forums_info)} 个板块信息")
             return True
         except Exception as e:
@@ -346,18 +475,16 @@ class CategoryService:
             是否更新成功
         """
         try:
-            counts = db.session.query(
-                Resource.section, db.func.count(Resource.id)
-            ).group_by(Resource.section).all()
-
-            count_map = {name: count for name, count in counts}
-
-            all_categories = Category.query.all()
-            for cat in all_categories:
-                cat.resource_count = count_map.get(cat.name, 0)
+            # 单条关联子查询 UPDATE 完成全部分类计数，不加载 ORM 对象
+            result = db.session.execute(text(
+                "UPDATE category SET resource_count = "
+                "(SELECT COUNT(*) FROM resource r WHERE r.section = category.name)"
+            ))
+            updated = result.rowcount or 0
 
             db.session.commit()
-            logger.info(f"成功更新 {len(all_categories)} 个分类的资源计数")
+            cache_manager.invalidate_data()
+            logger.info(f"成功更新 {updated} 个分类的资源计数")
             return True
         except Exception as e:
             db.session.rollback()
@@ -379,11 +506,16 @@ class CategoryService:
         Returns:
             分类列表
         """
+        cache_key = CacheKeys.build(CacheKeys.CATEGORIES_ALL, bool(include_stats), bool(include_defined))
+        cached = cache_manager.get(cache_key)
+        if cached is not None:
+            return cached
+
         result = {}
 
         # 使用联表查询一次性获取所有分类信息
         if include_stats and include_defined:
-            # 联表查询：Category表左连接Resource统计
+            # 单次左连接：无资源的分类 COUNT(Resource.id) 为 0，无需再查一遍补齐
             category_stats = db.session.query(
                 Category.name,
                 Category.fid,
@@ -392,9 +524,6 @@ class CategoryService:
                 func.count(Resource.id).label('resource_count')
             ).outerjoin(
                 Resource, Category.name == Resource.section
-            ).filter(
-                Resource.section.isnot(None),
-                Resource.section != ''
             ).group_by(
                 Category.id, Category.name, Category.fid,
                 Category.total_topics, Category.total_pages
@@ -409,27 +538,6 @@ class CategoryService:
                     'total_pages': total_pages or 0,
                     'fid': fid
                 }
-
-            # 添加定义但无数据的分类
-            defined_without_data = db.session.query(
-                Category.name, Category.fid,
-                Category.total_topics, Category.total_pages
-            ).outerjoin(
-                Resource, Category.name == Resource.section
-            ).filter(
-                Resource.id.is_(None)
-            ).all()
-
-            for name, fid, total_topics, total_pages in defined_without_data:
-                if name not in result:
-                    result[name] = {
-                        'name': name,
-                        'count': 0,
-                        'defined': True,
-                        'total_topics': total_topics or 0,
-                        'total_pages': total_pages or 0,
-                        'fid': fid
-                    }
         elif include_stats:
             # 仅获取数据库中实际存在的分类
             existing_categories = db.session.query(
@@ -460,7 +568,9 @@ class CategoryService:
                 }
 
         # 转换为列表并排序
-        return list(sorted(result.values(), key=lambda x: x['name']))
+        categories = sorted(result.values(), key=lambda x: x['name'])
+        cache_manager.set(cache_key, categories, ttl=_QUERY_CACHE_TTL)
+        return categories
 
     @staticmethod
     def get_category_by_fid(fid: str) -> Optional[Category]:
@@ -502,10 +612,14 @@ class StatisticsService:
         Returns:
             统计数据字典
         """
+        cached = cache_manager.get(CacheKeys.RESOURCE_STATS)
+        if cached is not None:
+            return cached
+
         total_count = Resource.query.count()
-        today_count = Resource.query.filter(
-            Resource.publish_date >= func.date(func.now())
-        ).count()
+        # 日期在 Python 中算好后作为绑定参数传入，publish_date 索引可直接做范围扫描
+        today = datetime.now(timezone.utc).date().isoformat()
+        today_count = Resource.query.filter(Resource.publish_date >= today).count()
 
         # 按分类统计
         category_stats = db.session.query(
@@ -523,11 +637,13 @@ class StatisticsService:
             for s, c in category_stats
         ]
 
-        return {
+        stats = {
             'total': total_count,
             'today': today_count,
             'categories': categories
         }
+        cache_manager.set(CacheKeys.RESOURCE_STATS, stats, ttl=_QUERY_CACHE_TTL)
+        return stats
 
     @staticmethod
     def get_database_info() -> Dict[str, Any]:
@@ -8,6 +8,7 @@ SHT2BM 适配器模块 - 将 SHT 数据层以 SHT2BM 兼容的 API 形式暴露
 import re
 import logging
 from flask import Blueprint, request, jsonify
+from sqlalchemy import select, or_, func
 from models import db, Resource
 from configuration import Config
 
@@ -20,12 +21,20 @@ sht2bm_bp = Blueprint('sht2bm', __name__)
 
 # ==================== 辅助函数 (保留原逻辑以确保兼容) ====================
 
+# 预编译的匹配规则（模块加载时编译一次）
+_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(GB|MB|KB|GIB|MIB|KIB)', re.IGNORECASE)
+_CHINESE_RE = re.compile(r'中字|中英')
+_C_SUFFIX_RE = re.compile(r'[-_]C\b', re.IGNORECASE)
+_UC_RE = re.compile(r'无码|破解|流出|FC2', re.IGNORECASE)
+_UHD_RE = re.compile(r'[48]K', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 def extract_size_from_text(text):
     """从文本中提取大小并转换为MB"""
     if not text:
         return 0.0
-    pattern = r'(\d+(?:\.\d+)?)\s*(GB|MB|KB|GIB|MIB|KIB)'
-    match = re.search(pattern, text, re.IGNORECASE)
+    match = _SIZE_RE.search(text)
     if match:
         try:
             value = float(match.group(1))
@@ -42,32 +51,20 @@ def extract_size_from_text(text):
 
 def determine_category_flags(title, sub_type, section):
     """根据标题和分类信息确定分类标志"""
-    title_upper = str(title).upper()
+    title = str(title)
 
     # chinese: 是否有中文字幕
-    is_chinese = False
-    if "中字" in title or "中英" in title:
-        is_chinese = True
-    if re.search(r'[-_]C\b', title_upper):
-        is_chinese = True
+    is_chinese = _CHINESE_RE.search(title) is not None or _C_SUFFIX_RE.search(title) is not None
 
     # uc: 是否为UC资源（无码/破解/流出/FC2/国产无码等）
-    is_uc = False
-    uc_keywords = ["无码", "破解", "流出", "FC2"]
-    if any(keyword in title for keyword in uc_keywords):
-        is_uc = True
-    if "FC2" in title_upper:
-        is_uc = True
-    
-    if sub_type and "无码" in sub_type:
+    is_uc = _UC_RE.search(title) is not None
+    if not is_uc and sub_type and "无码" in sub_type:
         is_uc = True
-    if section and ("无码" in section or "流出" in section):
+    if not is_uc and section and ("无码" in section or "流出" in section):
         is_uc = True
 
     # uhd: 是否为4K超高清
-    is_uhd = False
-    if "4K" in title_upper or "8K" in title_upper:
-        is_uhd = True
+    is_uhd = _UHD_RE.search(title) is not None
 
     return is_chinese, is_uc, is_uhd
 
@@ -77,7 +74,7 @@ def clean_title(title, sub_type):
         return "No Title"
 
     title = str(title).strip()
-    title = re.sub(r'\s+', ' ', title)
+    title = _WHITESPACE_RE.sub(' ', title)
 
     if title.lower() in ["none", "null"]:
         title = ""
@@ -90,8 +87,16 @@ def clean_title(title, sub_type):
 
     return title
 
-def convert_to_torrent_model(resource: Resource):
-    """将 Resource 模型对象转换为 Torrent Model"""
+# bt_api 只需要的列：按列查询返回轻量 Row，省去 ORM 对象构造与多余列解码
+_BT_COLUMNS = (
+    Resource.id, Resource.tid, Resource.title, Resource.sub_type,
+    Resource.section, Resource.size, Resource.detail_url, Resource.magnet,
+)
+_BT_RESULT_LIMIT = 50
+
+
+def convert_to_torrent_model(resource):
+    """将 Resource 模型对象（或含相同列属性的查询行）转换为 Torrent Model"""
     
     # 确定id (使用 tid 作为唯一标识)
     torrent_id = resource.tid or resource.id
@@ -159,21 +164,23 @@ def bt_api():
 
     logger.info(f"SHT2BM 搜索请求: [{keyword}]")
 
-    # 使用 Resource 模型进行搜索
-    # 限制返回 50 条结果以保持兼容性
-    pagination = Resource.search_resources(keyword, page=1, per_page=50)
-    resources = pagination.items
-
-    # 转换为 Torrent Model 并去重
-    results = []
-    seen_magnets = set()
-    
-    for res in resources:
-        if not res.magnet or res.magnet in seen_magnets:
-            continue
-            
-        seen_magnets.add(res.magnet)
-        results.append(convert_to_torrent_model(res))
+    # 与 Resource.search_resources 相同的匹配与排序，只取所需列，不做分页计数；
+    # 在 SQL 中按磁力链接去重（每个磁力保留 id 最大即最新的一条），直接返回最多 50 条不重复结果
+    pattern = f"%{keyword}%"
+    latest_per_magnet = select(func.max(Resource.id)).where(
+        or_(
+            Resource.title.ilike(pattern),
+            Resource.sub_type.ilike(pattern),
+            Resource.section.ilike(pattern)
+        ),
+        Resource.magnet.isnot(None),
+        Resource.magnet != ''
+    ).group_by(Resource.magnet)
+    stmt = select(*_BT_COLUMNS).where(Resource.id.in_(latest_per_magnet)) \
+        .order_by(Resource.created_at.desc()).limit(_BT_RESULT_LIMIT)
+
+    # 转换为 Torrent Model
+    results = [convert_to_torrent_model(res) for res in db.session.execute(stmt)]
 
     logger.debug(f"SHT2BM 搜索完成，返回 {len(results)} 条结果")
     return jsonify({"data": results})
@@ -1627,9 +1627,8 @@ class SHT:
 
             # 清除相关缓存
             try:
-                from cache_manager import cache_manager, CacheKeys
-                cache_manager.delete(CacheKeys.STATS)  # 清除统计缓存
-                cache_manager.delete(CacheKeys.CATEGORIES)  # 清除分类缓存
+                from cache_manager import cache_manager
+                cache_manager.invalidate_data()  # 清除统计与分类缓存
                 logger.debug(f"已清除相关缓存: tid={tid}")
             except Exception as e:
                 logger.warning(f"清除缓存失败: {e}")
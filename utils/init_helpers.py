@@ -34,6 +34,84 @@ def start_sht2bm_background():
     return sht2bm_thread
 
 
+# PostgreSQL 三元组索引：search_resources / get_resources_with_filters 中的
+# ilike('%kw%') 前导通配查询无法使用 B-tree，由 pg_trgm GIN 索引支撑
+_TRGM_INDEXES = (
+    ('idx_resource_title_trgm', 'title'),
+    ('idx_resource_subtype_trgm', 'sub_type'),
+    ('idx_resource_section_trgm', 'section'),
+)
+
+
+# 残缺数据筛选的部分索引：(索引名, RESOURCE_MISSING_CONDITIONS 键)
+# 以 created_at 为索引列，筛选后按入库时间倒序分页可直接沿索引读取
+_MISSING_INDEXES = (
+    ('idx_resource_sub_missing', 'sub_type'),
+    ('idx_resource_date_missing', 'date'),
+    ('idx_resource_size_missing', 'size'),
+)
+
+
+def _ensure_missing_indexes(db, logger):
+    """在 SQLite/PostgreSQL 上创建残缺数据筛选的部分索引（MySQL 不支持部分索引，跳过）"""
+    from sqlalchemy import text
+    from models import RESOURCE_MISSING_CONDITIONS
+
+    if db.engine.dialect.name not in ('sqlite', 'postgresql'):
+        return
+
+    try:
+        with db.engine.connect() as conn:
+            for index_name, key in _MISSING_INDEXES:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON resource (created_at) "
+                    f"WHERE {RESOURCE_MISSING_CONDITIONS[key]}"
+                ))
+            conn.commit()
+        logger.debug("[DB] 残缺数据部分索引检查完成")
+    except Exception as e:
+        logger.warning(f"! [DB] 无法创建残缺数据部分索引: {e}")
+
+
+def _ensure_pg_search_indexes(db, logger):
+    """在 PostgreSQL 上创建 resource 文本检索所需的结构（其他数据库跳过）
+
+    - pg_trgm 扩展及 title/sub_type/section 的 GIN 三元组索引
+    - search_tsv 全文检索生成列（title + sub_type）及其 GIN 索引，供多词搜索词首预过滤使用
+    """
+    from sqlalchemy import text
+
+    if db.engine.dialect.name != 'postgresql':
+        return
+
+    try:
+        with db.engine.connect() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for index_name, column in _TRGM_INDEXES:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON resource USING gin ({column} gin_trgm_ops)"
+                ))
+            conn.commit()
+        logger.debug("[DB] pg_trgm 三元组索引检查完成")
+    except Exception as e:
+        logger.warning(f"! [DB] 无法创建 pg_trgm 三元组索引: {e}")
+
+    try:
+        with db.engine.connect() as conn:
+            conn.execute(text(
+                "ALTER TABLE resource ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+                "GENERATED ALWAYS AS (to_tsvector('simple', "
+                "coalesce(title, '') || ' ' || coalesce(sub_type, ''))) STORED"
+            ))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_resource_search_tsv ON resource USING gin (search_tsv)"
+            ))
+            conn.commit()
+        logger.debug("[DB] search_tsv 全文检索列检查完成")
+    except Exception as e:
+        logger.warning(f"! [DB] 无法创建 search_tsv 全文检索列: {e}")
+
+
 def init_db_data(app):
     """初始化数据库数据 - 优化版本，避免重复初始化"""
     from models import db, Category
@@ -48,7 +126,7 @@ def init_db_data(app):
     with init_db_data._lock:
         # 检查是否已经初始化过
         if hasattr(init_db_data, '_initialized') and init_db_data._initialized:
-            logger.debug(f"[DB] 数据库已初始化，跳过重复初始化")
+            logger.debug("[DB] 数据库已初始化，跳过重复初始化")
             return True
 
         with app.app_context():
@@ -139,11 +217,26 @@ def init_db_data(app):
                                     if "already exists" not in str(e):
                                         logger.warning(f"! [DB] 无法补齐字段 failed_tid.{col_name}: {e}")
 
+                    # 4. 补齐 resource 表新增的复合索引（create_all 不会为已存在的表建索引）
+                    if 'resource' in existing_tables:
+                        existing_indexes = {idx['name'] for idx in inspector.get_indexes('resource')}
+                        if 'idx_section_created' not in existing_indexes:
+                            try:
+                                logger.info("[DB] 数据库自愈: 补齐索引 resource.idx_section_created")
+                                conn.execute(text("CREATE INDEX idx_section_created ON resource (section, created_at)"))
+                                conn.commit()
+                            except Exception as e:
+                                if "already exists" not in str(e):
+                                    logger.warning(f"! [DB] 无法补齐索引 resource.idx_section_created: {e}")
+
                 logger.info(f"✓ [DB] 数据库结构自愈巡检完成")
             except Exception as e:
                 logger.error(f"✗ [DB] 数据库初始化失败: {e}")
                 # 不中断主程序启动
 
+            _ensure_pg_search_indexes(db, logger)
+            _ensure_missing_indexes(db, logger)
+
             # 初始化分类数据 - 简化版本，减少日志输出
             from constants import SECTION_MAP
 
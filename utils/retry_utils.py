@@ -5,6 +5,7 @@ HTTP请求重试工具 - 提供带指数退避的重试策略
 """
 
 import time
+import asyncio
 import logging
 from typing import Callable, Any, Optional, List, Type
 from functools import wraps
@@ -185,6 +186,75 @@ def retry_request(
     return None
 
 
+async def async_retry_request(
+    request_func: Callable,
+    max_retries: int = 3,
+    timeout: int = 30,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    backoff_factor: float = 2.0,
+    raise_on_fail: bool = True,
+    **kwargs
+) -> Optional[Any]:
+    """
+    retry_request 的协程版本：request_func 为协程函数（如 httpx.AsyncClient.post），
+    退避等待使用 asyncio.sleep，不阻塞事件循环；参数与返回值同 retry_request
+
+    Example:
+        response = await async_retry_request(
+            client.post,
+            url='http://example.com',
+            **RETRY_CONFIG['telegram']
+        )
+    """
+    last_exception = None
+
+    for attempt in range(max_retries + 1):
+        try:
+            if 'timeout' not in kwargs:
+                kwargs['timeout'] = timeout
+
+            response = await request_func(**kwargs)
+
+            if hasattr(response, 'status_code'):
+                if 200 <= response.status_code < 300:
+                    return response
+                else:
+                    if attempt < max_retries:
+                        raise Exception(
+                            f"HTTP {response.status_code}: {response.text[:200]}"
+                        )
+
+            return response
+
+        except Exception as e:
+            last_exception = e
+
+            if attempt >= max_retries:
+                logger.error(
+                    f"[RETRY] HTTP请求达到最大重试次数 {max_retries}，放弃重试 - "
+                    f"错误: {e}"
+                )
+                if raise_on_fail:
+                    raise MaxRetriesExceededError(
+                        f"HTTP请求失败（重试{max_retries}次）: {e}"
+                    ) from e
+                return None
+
+            delay = min(base_delay * (backoff_factor ** attempt), max_delay)
+
+            logger.warning(
+                f"[RETRY] HTTP请求第 {attempt + 1}/{max_retries} 次失败 - "
+                f"错误: {e}, {delay:.1f}秒后重试..."
+            )
+
+            await asyncio.sleep(delay)
+
+    if raise_on_fail:
+        raise last_exception
+    return None
+
+
 # 预定义的重试配置
 RETRY_CONFIG = {
     'telegram': {
@@ -92,6 +92,9 @@ class StateManager:
         self._state = UnifiedCrawlState()
         self._lock = threading.RLock()
         self._version = 0
+        # 缓存写入单独加锁，记录已写入缓存的最新版本，防止旧快照覆盖新快照
+        self._cache_lock = threading.Lock()
+        self._cached_version = -1
         self._subscribers = []  # 状态变更订阅者
         
     def get_state(self, client_version: int = 0) -> Dict[str, Any]:
@@ -130,42 +133,50 @@ class StateManager:
         Returns:
             是否有实际更新
         """
+        # 锁内只做内存中的字段比较与赋值，并取一份快照；
+        # 缓存写入（文件/Redis I/O）与订阅通知移到锁外，写者之间不再因 I/O 互相阻塞
         with self._lock:
-            has_changes = False
+            state = self._state
             changes = []
-            
+
             # 记录变更的字段
             for key, new_value in updates.items():
-                if hasattr(self._state, key):
-                    old_value = getattr(self._state, key)
+                if hasattr(state, key):
+                    old_value = getattr(state, key)
                     if old_value != new_value:
-                        setattr(self._state, key, new_value)
+                        setattr(state, key, new_value)
                         changes.append(key)
-                        has_changes = True
-            
-            if has_changes:
-                # 更新版本和时间戳
-                self._version += 1
-                self._state.version = self._version
-                self._state.last_update_time = time.time()
-                
-                # 同步到缓存
-                self._sync_to_cache()
-                
-                # 通知订阅者
-                self._notify_subscribers(changes, source)
-                
-                logger.debug(f"状态更新 [v{self._version}] 来源:{source} 变更:{changes}")
-            
-            return has_changes
+
+            if not changes:
+                return False
+
+            # 更新版本和时间戳
+            self._version += 1
+            version = self._version
+            state.version = version
+            state.last_update_time = time.time()
+            snapshot = state.to_dict()
+
+        # 同步到缓存
+        self._sync_to_cache(snapshot, version)
+
+        # 通知订阅者
+        self._notify_subscribers(changes, source)
+
+        logger.debug(f"状态更新 [v{version}] 来源:{source} 变更:{changes}")
+
+        return True
     
+    def get_version(self) -> int:
+        """当前状态版本号（整数读取，无需加锁）"""
+        return self._version
+
     def sync_from_legacy_sources(self):
         """从传统状态源同步数据"""
         try:
             # 从缓存获取传统状态
-            crawl_status = cache_manager.shared_get(CacheKeys.CRAWL_STATUS) or {}
-            crawl_progress = cache_manager.shared_get(CacheKeys.CRAWL_PROGRESS) or {}
-            crawl_control = cache_manager.shared_get(CacheKeys.CRAWL_CONTROL) or {}
+            crawl_status, crawl_progress, crawl_control = (v or {} for v in cache_manager.shared_mget(
+                (CacheKeys.CRAWL_STATUS, CacheKeys.CRAWL_PROGRESS, CacheKeys.CRAWL_CONTROL)))
             
             # 合并状态信息
             updates = {}
@@ -213,11 +224,22 @@ class StateManager:
         except Exception as e:
             logger.debug(f"从传统状态源同步失败: {e}")
     
-    def _sync_to_cache(self):
-        """同步到缓存"""
+    def _sync_to_cache(self, state_dict: Dict = None, version: int = None):
+        """同步到缓存
+
+        state_dict/version 为锁内取得的快照；并发写入时只允许更新版本的快照覆盖缓存
+        """
         try:
-            state_dict = self._state.to_dict()
-            cache_manager.shared_set(CacheKeys.CRAWL_UNIFIED_STATE, state_dict)
+            if state_dict is None:
+                with self._lock:
+                    state_dict = self._state.to_dict()
+                    version = self._version
+            with self._cache_lock:
+                if version is not None and version < self._cached_version:
+                    return
+                cache_manager.shared_set(CacheKeys.CRAWL_UNIFIED_STATE, state_dict)
+                if version is not None:
+                    self._cached_version = version
         except Exception as e:
             logger.debug(f"同步到缓存失败: {e}")
     
@@ -290,9 +312,11 @@ class StateManager:
         with self._lock:
             self._state = UnifiedCrawlState()
             self._version += 1
-            self._state.version = self._version
-            self._sync_to_cache()
-            logger.info("状态已重置")
+            version = self._version
+            self._state.version = version
+            snapshot = self._state.to_dict()
+        self._sync_to_cache(snapshot, version)
+        logger.info("状态已重置")
 
 
 # 全局状态管理器实例
@@ -322,4 +346,9 @@ def update_unified_state(updates: Dict[str, Any], source: str = 'unknown') -> bo
 
 def sync_from_legacy() -> None:
     """从传统状态源同步（便捷函数）"""
-    get_state_manager().sync_from_legacy_sources()
\ No newline at end of file
+    get_state_manager().sync_from_legacy_sources()
+
+
+def get_unified_version() -> int:
+    """获取统一状态版本号（便捷函数）"""
+    return get_state_manager().get_version()